@@ -2,9 +2,17 @@ import streamlit as st
 st.set_page_config(page_title="Chronic Disease Prediction and Management")
 from features import (
     home, diabetes, heart, kidney, liver, lung_cancer,
-    fever, hypertension, symptom_tracker, disease_predictor,privacy)
+    fever, hypertension, symptom_tracker, disease_predictor,privacy, batch_screening)
 from core.auth import handle_auth
 from core.helper import t
+from config import settings
+
+# Load and exercise the models once per process (in-process mode only; the
+# inference server warms itself up). A no-op when started via core.serve_app
+# or core.launcher, which warm up before the first session arrives.
+if not settings.INFERENCE_SERVER_URL:
+    from core.warmup import start_warmup
+    start_warmup()
 
 if "language" not in st.session_state:
     st.session_state["language"] = "English"
@@ -63,7 +71,7 @@ else:
     # If logged in, show the full menu (e.g., Disease Prediction, etc.)
     menu = st.sidebar.selectbox("Navigation", [
         "Home", "Disease Prediction", "Hypertension", "Diabetes",
-        "Heart Disease", "Kidney Disease","Lung Cancer", "Fever", "Symptom Tracker","Privacy"
+        "Heart Disease", "Kidney Disease","Lung Cancer", "Fever", "Symptom Tracker", "Batch Screening", "Privacy"
     ])
 
     # Handle routing for different pages
@@ -85,5 +93,14 @@ else:
         fever.run()
     elif menu == "Symptom Tracker":
         symptom_tracker.run()
+    elif menu == "Batch Screening":
+        batch_screening.run()
     elif menu=="Privacy":
-        privacy.run()
\ No newline at end of file
+        privacy.run()
+
+# What this session keeps in memory (scan images count at their stored report size)
+if settings.SESSION_MEMORY_REPORT:
+    from core.memreport import session_report
+    from core.scan_store import scan_store
+    with st.sidebar.expander("Session memory"):
+        st.code(session_report(st.session_state, scan_store))
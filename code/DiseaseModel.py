@@ -1,14 +1,21 @@
+import numpy as np
 import xgboost as xgb
-import pandas as pd
+from scipy.sparse import csr_matrix
+from code.helper import load_symptom_index
+from code.knowledge_base import load_knowledge_base
 
 class DiseaseModel:
+    '''
+    Loaded once per process and shared by every session, so it holds no
+    per-request state: predict() returns its result instead of storing it
+    '''
 
     def __init__(self):
-        self.all_symptoms = None
-        self.symptoms = None
-        self.pred_disease = None
+        index = load_symptom_index()
+        self.index = index
+        self.all_symptoms = tuple(index.symptoms)
+        self.diseases = tuple(index.diseases)
         self.model = xgb.XGBClassifier()
-        self.diseases = self.disease_list('C:/Users/New/Downloads/CDPrediction/data/dataset.csv')
 
     def load_xgboost(self, model_path):
         self.model.load_model(model_path)
@@ -17,60 +24,63 @@ class DiseaseModel:
         self.model.save_model(model_path)
 
     def predict(self, X):
-        self.symptoms = X
-        disease_pred_idx = self.model.predict(self.symptoms)
-        self.pred_disease = self.diseases[disease_pred_idx].values[0]
-        disease_probability_array = self.model.predict_proba(self.symptoms)
-        disease_probability = disease_probability_array[0, disease_pred_idx[0]]
-        return self.pred_disease, disease_probability
+        # One probability pass; the label is its argmax
+        disease_probability_array = self.model.predict_proba(X)
+        disease_pred_idx = int(np.argmax(disease_probability_array[0]))
+        pred_disease = self.diseases[disease_pred_idx]
+        disease_probability = disease_probability_array[0, disease_pred_idx]
+        return pred_disease, disease_probability
+
+    def vectorize(self, symptom_sets):
+        '''Many symptom lists as one CSR matrix (k non-zeros per row instead of 133 floats)'''
+        indptr, indices = [0], []
+        for symptoms in symptom_sets:
+            indices.extend(self.index.positions(symptoms))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float32)
+        return csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(self.all_symptoms)))
+
+    def predict_proba_sparse(self, X_sparse, chunk_size=10000):
+        '''
+        Class probabilities for a CSR batch in one booster pass per chunk.
+        The model was trained on dense 0/1 columns, and XGBoost treats entries
+        absent from a CSR matrix as missing rather than 0, so each chunk is
+        densified to float32 before the in-place prediction.
+        '''
+        booster = self.model.get_booster()
+        chunks = []
+        for start in range(0, X_sparse.shape[0], chunk_size):
+            dense = X_sparse[start:start + chunk_size].toarray()
+            chunks.append(booster.inplace_predict(dense))
+        if not chunks:
+            return np.zeros((0, len(self.diseases)), dtype=np.float32)
+        return np.vstack(chunks)
+
+    def predict_topk(self, symptom_sets, k=5):
+        '''
+        Top-k differential diagnoses for each symptom list:
+        [[(disease, probability), ...], ...], most likely first
+        '''
+        if k < 1:
+            raise ValueError(f'k must be at least 1, got {k}')
+        probabilities = self.predict_proba_sparse(self.vectorize(symptom_sets))
+        k = min(k, probabilities.shape[1])
+        top = np.argpartition(-probabilities, k - 1, axis=1)[:, :k]
+        rows = np.arange(len(probabilities))[:, None]
+        top = top[rows, np.argsort(-probabilities[rows, top], axis=1)]
+        return [[(self.diseases[j], float(probabilities[i, j])) for j in top[i]] for i in range(len(top))]
 
     
     def describe_disease(self, disease_name):
 
         if disease_name not in self.diseases:
             return "That disease is not contemplated in this model"
-        
-        # Read disease dataframe
-        desc_df = pd.read_csv('C:/Users/New/Downloads/CDPrediction/data/symptom_Description.csv')
-        desc_df = desc_df.apply(lambda col: col.str.strip())
 
-        return desc_df[desc_df['Disease'] == disease_name]['Description'].values[0]
-
-    def describe_predicted_disease(self):
-
-        if self.pred_disease is None:
-            return "No predicted disease yet"
-
-        return self.describe_disease(self.pred_disease)
+        return load_knowledge_base().lookup(disease_name)['description']
     
     def disease_precautions(self, disease_name):
 
         if disease_name not in self.diseases:
             return "That disease is not contemplated in this model"
 
-        # Read precautions dataframe
-        prec_df = pd.read_csv('C:/Users/New/Downloads/CDPrediction/data/symptom_precaution.csv')
-        prec_df = prec_df.apply(lambda col: col.str.strip())
-
-        return prec_df[prec_df['Disease'] == disease_name].filter(regex='Precaution').values.tolist()[0]
-
-    def predicted_disease_precautions(self):
-
-        if self.pred_disease is None:
-            return "No predicted disease yet"
-
-        return self.disease_precautions(self.pred_disease)
-
-    def disease_list(self, kaggle_dataset):
-
-        df = pd.read_csv('C:/Users/New/Downloads/CDPrediction/data/clean_dataset.tsv', sep='\t')
-        # Preprocessing
-        y_data = df.iloc[:,-1]
-        X_data = df.iloc[:,:-1]
-
-        self.all_symptoms = X_data.columns
-
-        # Convert y to categorical values
-        y_data = y_data.astype('category')
-        
-        return y_data.cat.categories
\ No newline at end of file
+        return load_knowledge_base().lookup(disease_name)['precautions']
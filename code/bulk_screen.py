@@ -0,0 +1,159 @@
+"""
+Bulk symptom screening with the disease model.
+
+    python -m code.bulk_screen history.csv predictions.csv --workers 8
+    python -m code.bulk_screen history.jsonl predictions.jsonl --top-k 3
+
+Input rows carry a list of symptoms: a CSV column (default "symptoms") holding
+names separated by --sep, or a JSONL field holding a list or a --sep string.
+Every other field is copied to the output next to the prediction, top-k
+probabilities, description and precautions. Chunks are spread over a process
+pool; each worker loads its own booster once.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import sys
+import time
+from itertools import islice
+
+from code.helper import UnknownSymptomError
+from code.knowledge_base import load_knowledge_base
+
+MODEL_PATH = "models/xgboost_model.json"
+OUTPUT_FIELDS = ["prediction", "probability", "top_k", "description", "precautions", "error"]
+
+_worker = {}
+
+def _init_worker(model_path, top_k):
+    from code.DiseaseModel import DiseaseModel
+    disease_model = DiseaseModel()
+    disease_model.load_xgboost(model_path)
+    # Parallelism comes from the pool, so each booster uses one thread
+    disease_model.model.get_booster().set_param({"nthread": 1})
+    _worker["model"] = disease_model
+    _worker["knowledge_base"] = load_knowledge_base()
+    _worker["top_k"] = top_k
+
+def _score_chunk(records):
+    disease_model = _worker["model"]
+    knowledge_base = _worker["knowledge_base"]
+
+    valid = []
+    for record in records:
+        if not record["symptoms"]:
+            # An all-zero vector would still get a confident-looking diagnosis
+            record["error"] = "No symptoms"
+            continue
+        try:
+            disease_model.index.positions(record["symptoms"])
+            valid.append(record)
+        except UnknownSymptomError as e:
+            record["error"] = str(e)
+
+    if valid:
+        ranked = disease_model.predict_topk([record["symptoms"] for record in valid], k=_worker["top_k"])
+        for record, top in zip(valid, ranked):
+            info = knowledge_base.lookup(top[0][0]) or {"description": "", "precautions": []}
+            record.update({
+                "prediction": top[0][0],
+                "probability": round(top[0][1], 6),
+                "top_k": [[disease, round(p, 6)] for disease, p in top],
+                "description": info["description"],
+                "precautions": info["precautions"],
+                "error": "",
+            })
+    return records
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+def read_records(path, symptom_column, sep):
+    if path.endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    if isinstance(record, list):
+                        record = {"symptoms": record}
+                    else:
+                        record["symptoms"] = record.pop(symptom_column, None) or []
+                    if isinstance(record["symptoms"], str):
+                        # Same delimited form as the CSV column, not a list of characters
+                        record["symptoms"] = [s.strip() for s in record["symptoms"].split(sep) if s.strip()]
+                    yield record
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                raw = row.pop(symptom_column, "") or ""
+                row["symptoms"] = [s.strip() for s in raw.split(sep) if s.strip()]
+                yield row
+
+def chunked(records, size):
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+class OutputWriter:
+    def __init__(self, path):
+        self.path = path
+        self.jsonl = path.endswith(".jsonl")
+        self.file = open(path, "w", newline="", encoding="utf-8")
+        self.writer = None
+
+    def write(self, records):
+        for record in records:
+            if self.jsonl:
+                self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+                continue
+            row = dict(record)
+            row["symptoms"] = ";".join(row["symptoms"])
+            for field in ("top_k", "precautions"):
+                row[field] = json.dumps(row.get(field, []), ensure_ascii=False)
+            if self.writer is None:
+                fields = [k for k in row if k not in OUTPUT_FIELDS] + OUTPUT_FIELDS
+                self.writer = csv.DictWriter(self.file, fieldnames=fields, extrasaction="ignore")
+                self.writer.writeheader()
+            self.writer.writerow(row)
+
+    def close(self):
+        self.file.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("input", help="CSV or JSONL file of symptom lists")
+    parser.add_argument("output", help="CSV or JSONL file for the predictions")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--top-k", type=positive_int, default=5)
+    parser.add_argument("--symptom-column", default="symptoms")
+    parser.add_argument("--sep", default=";", help="symptom separator inside a CSV cell or JSONL string")
+    parser.add_argument("--model", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    records = read_records(args.input, args.symptom_column, args.sep)
+    writer = OutputWriter(args.output)
+    start = time.perf_counter()
+    done = errors = 0
+    with multiprocessing.Pool(args.workers, initializer=_init_worker, initargs=(args.model, args.top_k)) as pool:
+        # imap keeps input order while streaming finished chunks back
+        for scored in pool.imap(_score_chunk, chunked(records, args.chunk_size)):
+            writer.write(scored)
+            done += len(scored)
+            errors += sum(1 for record in scored if record.get("error"))
+            elapsed = time.perf_counter() - start
+            print(f"\r{done:,} rows  {done / elapsed:,.0f} rows/s  {errors:,} errors", end="", file=sys.stderr)
+    writer.close()
+    elapsed = time.perf_counter() - start
+    print(f"\nScored {done:,} rows in {elapsed:.1f}s ({done / max(elapsed, 1e-9):,.0f} rows/s) -> {args.output}",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
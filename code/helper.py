@@ -1,20 +1,80 @@
+import json
+import os
+from functools import lru_cache
 import pandas as pd
 import numpy as np
 
+DATASET_PATH = 'C:/Users/New/Downloads/CDPrediction/data/clean_dataset.tsv'
+# Built once from the training dataset and kept next to xgboost_model.json
+SYMPTOM_INDEX_PATH = 'models/symptom_index.json'
+
+
+class UnknownSymptomError(ValueError):
+    pass
+
+
+class SymptomIndex:
+    '''
+    Symptom vocabulary of the disease model: column position of every symptom
+    and the disease labels in the order the model predicts them
+    '''
+
+    def __init__(self, symptoms, diseases):
+        self.symptoms = list(symptoms)
+        self.diseases = list(diseases)
+        self.position = {symptom: i for i, symptom in enumerate(self.symptoms)}
+
+    def __len__(self):
+        return len(self.symptoms)
+
+    def positions(self, symptoms):
+        unknown = [symptom for symptom in symptoms if symptom not in self.position]
+        if unknown:
+            raise UnknownSymptomError(f"Unknown symptom(s): {', '.join(unknown)}")
+        return [self.position[symptom] for symptom in symptoms]
+
+
+def build_symptom_index(dataset_path=DATASET_PATH, index_path=SYMPTOM_INDEX_PATH):
+    '''
+    Read the training dataset once and persist its symptom columns and
+    disease categories as a small JSON artifact
+    '''
+    df = pd.read_csv(dataset_path, sep='\t')
+    symptoms = df.columns[:-1].tolist()
+    diseases = df.iloc[:, -1].astype('category').cat.categories.tolist()
+
+    os.makedirs(os.path.dirname(index_path) or '.', exist_ok=True)
+    with open(index_path, 'w', encoding='utf-8') as f:
+        json.dump({'symptoms': symptoms, 'diseases': diseases}, f)
+    return SymptomIndex(symptoms, diseases)
+
+
+@lru_cache(maxsize=None)
+def load_symptom_index(index_path=SYMPTOM_INDEX_PATH):
+    if not os.path.exists(index_path):
+        return build_symptom_index(index_path=index_path)
+    with open(index_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return SymptomIndex(data['symptoms'], data['diseases'])
+
 
 def prepare_symptoms_array(symptoms):
     '''
-    Convert a list of symptoms to a ndim(X) (in this case 131) that matches the
+    Convert a list of symptoms to a ndim(X) (in this case 133) that matches the
     dataframe used to train the machine learning model
 
     Output:
     - X (np.array) = X values ready as input to ML model to get prediction
+
+    Raises UnknownSymptomError for symptoms outside the model vocabulary
     '''
-    symptoms_array = np.zeros((1,133))
-    df = pd.read_csv('C:/Users/New/Downloads/CDPrediction/data/clean_dataset.tsv', sep='\t')
-    
-    for symptom in symptoms:
-        symptom_idx = df.columns.get_loc(symptom)
-        symptoms_array[0, symptom_idx] = 1
-
-    return symptoms_array
\ No newline at end of file
+    index = load_symptom_index()
+    symptoms_array = np.zeros((1, len(index)))
+    symptoms_array[0, index.positions(symptoms)] = 1
+
+    return symptoms_array
+
+
+if __name__ == '__main__':
+    index = build_symptom_index()
+    print(f"Wrote {SYMPTOM_INDEX_PATH}: {len(index.symptoms)} symptoms, {len(index.diseases)} diseases")
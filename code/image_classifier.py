@@ -0,0 +1,81 @@
+import hashlib
+import io
+from functools import lru_cache
+import numpy as np
+from PIL import Image
+
+# Uploads larger than this are refused from their header, before any pixel is decoded
+MAX_IMAGE_PIXELS = 64_000_000
+
+
+class ImageTooLargeError(ValueError):
+    pass
+
+
+@lru_cache(maxsize=None)
+def load_labels(label_path):
+    '''Class names of an imaging model, one per line, read once per process'''
+    with open(label_path, "r") as f:
+        return tuple(line.strip() for line in f.readlines())
+
+
+def preprocess_image(image_bytes, input_size, pixel_scale=255.0):
+    '''(H, W, 3) float32 tensor for one encoded image'''
+    image = Image.open(io.BytesIO(image_bytes))  # reads the header only
+    width, height = image.size
+    if width * height > MAX_IMAGE_PIXELS:
+        raise ImageTooLargeError(f"Image is {width}x{height}; the limit is {MAX_IMAGE_PIXELS} pixels")
+    # JPEGs are decoded at the smallest 1/2, 1/4 or 1/8 scale still above the
+    # model input, so a 12MP scan never materializes at full resolution
+    image.draft("RGB", input_size)
+    image = image.convert("RGB")
+    # reducing_gap shrinks by whole factors first, then resamples the small image
+    image = image.resize(input_size, reducing_gap=3.0)  # Match the expected model input size
+    # Stay in uint8 until this single float32 normalization
+    pixels = np.asarray(image)
+    tensor = np.empty(pixels.shape, dtype=np.float32)
+    np.divide(pixels, np.float32(pixel_scale), out=tensor)
+    return tensor
+
+
+class ImageClassifier:
+    '''
+    One CNN together with how its inputs are prepared: input size, the value
+    pixels are divided by and its label file. `cache` is optional and only
+    needs get/put; when given, preprocessed tensors are reused for repeated
+    uploads of the same bytes.
+    '''
+
+    def __init__(self, model, label_path, input_size=(150, 150), pixel_scale=255.0, cache=None):
+        self.model = model
+        self.labels = load_labels(label_path)
+        self.input_size = tuple(input_size)
+        self.pixel_scale = pixel_scale
+        self.cache = cache
+
+    def preprocess(self, image_bytes):
+        '''preprocess_image with this model's settings, cached when a cache is set'''
+        if self.cache is None:
+            return preprocess_image(image_bytes, self.input_size, self.pixel_scale)
+        key = hashlib.sha256(image_bytes).hexdigest()
+        tensor = self.cache.get(key)
+        if tensor is None:
+            tensor = preprocess_image(image_bytes, self.input_size, self.pixel_scale)
+            tensor.setflags(write=False)
+            self.cache.put(key, tensor)
+        return tensor
+
+    def decode(self, prediction):
+        '''(label, confidence in percent) for one row of model output'''
+        return self.labels[int(np.argmax(prediction))], float(np.max(prediction) * 100)
+
+    def classify(self, image_bytes):
+        prediction = self.model.predict(self.preprocess(image_bytes)[None])
+        return self.decode(prediction[0])
+
+    def classify_batch(self, images):
+        '''Classify several encoded images with a single model call'''
+        if not images:
+            return []
+        batch = np.stack([self.preprocess(image_bytes) for image_bytes in images])
+        return [self.decode(row) for row in self.model.predict(batch)]
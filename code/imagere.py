@@ -1,24 +1,16 @@
-from PIL import Image
+from config import settings
+from code.runtime import load_image_model
+from code.image_classifier import ImageClassifier, load_labels
 import numpy as np
-import tensorflow as tf
-import io
 
-def imagerecognise(image_bytes, model_path, label_path):
-    image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
-    image = image.resize((224, 224))  # resize to match model input
-    img_array = tf.keras.preprocessing.image.img_to_array(image)
-    img_array = np.expand_dims(img_array, axis=0)
-    img_array = img_array / 255.0  # normalize
-
-    model = model_path
-    prediction = model.predict(img_array)
-
-    y = decode_prediction(prediction, label_path)
-    conf = np.max(prediction) * 100
-    return y, conf
+def imagerecognise(image_bytes, model_path, label_path, engine=None):
+    # model_path is either a loaded model or an artifact stem such as "models/lungcnn",
+    # in which case the engine (keras, tflite, onnx) picks which export to run
+    if isinstance(model_path, str):
+        model = load_image_model(model_path, engine or settings.CNN_ENGINE, settings.CNN_PRECISION)
+    else:
+        model = model_path
+    return ImageClassifier(model, label_path, input_size=(224, 224)).classify(image_bytes)
 
 def decode_prediction(prediction, label_path):
-    with open(label_path, "r") as f:
-        labels = [line.strip() for line in f.readlines()]
-    predicted_index = np.argmax(prediction)
-    return labels[predicted_index]
+    return load_labels(label_path)[np.argmax(prediction)]
@@ -0,0 +1,83 @@
+import json
+import os
+from functools import lru_cache
+import pandas as pd
+
+DESCRIPTION_PATH = 'C:/Users/New/Downloads/CDPrediction/data/symptom_Description.csv'
+PRECAUTION_PATH = 'C:/Users/New/Downloads/CDPrediction/data/symptom_precaution.csv'
+KNOWLEDGE_BASE_PATH = 'models/disease_kb.json'
+
+
+def normalize_name(disease_name):
+    return " ".join(str(disease_name).strip().lower().split())
+
+
+class DiseaseKnowledgeBase:
+    '''
+    Descriptions and precautions for every disease, keyed by normalized name.
+    Entries may carry precomputed Tamil text ("description_ta", "precautions_ta").
+    '''
+
+    def __init__(self, entries):
+        self.entries = {normalize_name(entry['name']): entry for entry in entries}
+
+    def __contains__(self, disease_name):
+        return normalize_name(disease_name) in self.entries
+
+    def lookup(self, disease_name, language="English"):
+        '''Description and precautions in one call, or None for an unknown disease'''
+        entry = self.entries.get(normalize_name(disease_name))
+        if entry is None:
+            return None
+        if language == "Tamil" and entry.get('description_ta'):
+            return {'description': entry['description_ta'], 'precautions': entry.get('precautions_ta', entry['precautions'])}
+        return {'description': entry['description'], 'precautions': entry['precautions']}
+
+
+def read_catalog(description_path=DESCRIPTION_PATH, precaution_path=PRECAUTION_PATH):
+    desc_df = pd.read_csv(description_path)
+    desc_df = desc_df.apply(lambda col: col.str.strip())
+    prec_df = pd.read_csv(precaution_path)
+    prec_df = prec_df.apply(lambda col: col.str.strip())
+
+    entries = {}
+    for disease, description in zip(desc_df['Disease'], desc_df['Description']):
+        entries[disease] = {'name': disease, 'description': description, 'precautions': []}
+    precaution_cols = prec_df.filter(regex='Precaution').columns
+    for row in prec_df.itertuples(index=False):
+        row = row._asdict()
+        entry = entries.setdefault(row['Disease'], {'name': row['Disease'], 'description': '', 'precautions': []})
+        entry['precautions'] = [row[col] for col in precaution_cols if isinstance(row[col], str) and row[col]]
+    return list(entries.values())
+
+
+def build_knowledge_base(kb_path=KNOWLEDGE_BASE_PATH, translate=False):
+    '''
+    Read both CSVs once and write the knowledge base JSON. With translate=True the
+    Tamil text is generated here, offline, so pages never translate at request time.
+    '''
+    entries = read_catalog()
+    if translate:
+        from core.helper import translate_text
+        for entry in entries:
+            entry['description_ta'] = translate_text(entry['description'])
+            entry['precautions_ta'] = [translate_text(p) for p in entry['precautions']]
+
+    os.makedirs(os.path.dirname(kb_path) or '.', exist_ok=True)
+    with open(kb_path, 'w', encoding='utf-8') as f:
+        json.dump(entries, f, ensure_ascii=False)
+    return DiseaseKnowledgeBase(entries)
+
+
+@lru_cache(maxsize=None)
+def load_knowledge_base(kb_path=KNOWLEDGE_BASE_PATH):
+    if not os.path.exists(kb_path):
+        return DiseaseKnowledgeBase(read_catalog())
+    with open(kb_path, 'r', encoding='utf-8') as f:
+        return DiseaseKnowledgeBase(json.load(f))
+
+
+if __name__ == '__main__':
+    import sys
+    kb = build_knowledge_base(translate='--tamil' in sys.argv)
+    print(f"Wrote {KNOWLEDGE_BASE_PATH}: {len(kb.entries)} diseases")
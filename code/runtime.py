@@ -0,0 +1,81 @@
+import os
+import threading
+from functools import lru_cache
+import numpy as np
+
+# Serving engines for the imaging CNNs and the artifact suffix each one loads
+ENGINE_SUFFIXES = {
+    "keras": ".h5",
+    "tflite": ".tflite",
+    "onnx": ".onnx",
+}
+
+class TFLiteModel:
+    """TFLite interpreter with a Keras-like predict(batch) method"""
+
+    def __init__(self, path, num_threads=None):
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            import tensorflow as tf
+            Interpreter = tf.lite.Interpreter
+        self.interpreter = Interpreter(model_path=path, num_threads=num_threads or os.cpu_count())
+        self.interpreter.allocate_tensors()
+        self.input = self.interpreter.get_input_details()[0]
+        self.output = self.interpreter.get_output_details()[0]
+        self._lock = threading.Lock()
+
+    def predict(self, x):
+        x = np.asarray(x, dtype=np.float32)
+        # The interpreter holds mutable tensors, so one forward pass at a time
+        with self._lock:
+            if tuple(self.input["shape"]) != x.shape:
+                self.interpreter.resize_tensor_input(self.input["index"], x.shape)
+                self.interpreter.allocate_tensors()
+                self.input = self.interpreter.get_input_details()[0]
+                self.output = self.interpreter.get_output_details()[0]
+            self.interpreter.set_tensor(self.input["index"], x)
+            self.interpreter.invoke()
+            return self.interpreter.get_tensor(self.output["index"]).copy()
+
+class OnnxModel:
+    """onnxruntime CPU session with a Keras-like predict(batch) method"""
+
+    def __init__(self, path, num_threads=None):
+        import onnxruntime as ort
+        options = ort.SessionOptions()
+        if num_threads:
+            options.intra_op_num_threads = num_threads
+        self.session = ort.InferenceSession(path, options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict(self, x):
+        return self.session.run(None, {self.input_name: np.asarray(x, dtype=np.float32)})[0]
+
+# Post-training quantized variants, produced by export_cnn quantize (TFLite only)
+PRECISIONS = ("float32", "float16", "int8")
+
+def model_path(stem, engine, precision="float32"):
+    """Artifact path for a model stem such as 'models/lungcnn' under the given engine and precision"""
+    if engine not in ENGINE_SUFFIXES:
+        raise ValueError(f"Unknown engine: {engine}. Choose from {list(ENGINE_SUFFIXES)}")
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision: {precision}. Choose from {list(PRECISIONS)}")
+    if precision != "float32":
+        if engine != "tflite":
+            raise ValueError(f"{precision} models are only available with the tflite engine")
+        return f"{stem}_{precision}.tflite"
+    return stem + ENGINE_SUFFIXES[engine]
+
+def load_model_file(path):
+    """Load an imaging model with the runtime matching its file suffix"""
+    if path.endswith(".tflite"):
+        return TFLiteModel(path)
+    if path.endswith(".onnx"):
+        return OnnxModel(path)
+    import tensorflow as tf
+    return tf.keras.models.load_model(path)
+
+@lru_cache(maxsize=None)
+def load_image_model(stem, engine, precision="float32"):
+    return load_model_file(model_path(stem, engine, precision))
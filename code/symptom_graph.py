@@ -0,0 +1,34 @@
+import json
+import os
+from functools import lru_cache
+
+# Written offline by code/train/build_symptom_graph.py
+GRAPH_PATH = 'models/symptom_neighbors.json'
+
+
+class SymptomGraph:
+    '''Precomputed top-N co-occurrence neighbours for each symptom'''
+
+    def __init__(self, neighbours):
+        self.neighbours = neighbours
+
+    def suggest(self, selected, limit=5):
+        '''
+        Symptoms most associated with the current selection. Work is bounded by
+        len(selected) x N stored neighbours, independent of the dataset size.
+        '''
+        selected = set(selected)
+        scores = {}
+        for symptom in selected:
+            for neighbour, score in self.neighbours.get(symptom, ()):
+                if neighbour not in selected:
+                    scores[neighbour] = scores.get(neighbour, 0.0) + score
+        return sorted(scores, key=lambda s: -scores[s])[:limit]
+
+
+@lru_cache(maxsize=None)
+def load_symptom_graph(graph_path=GRAPH_PATH):
+    if not os.path.exists(graph_path):
+        return SymptomGraph({})
+    with open(graph_path, 'r', encoding='utf-8') as f:
+        return SymptomGraph(json.load(f))
@@ -0,0 +1,206 @@
+import json
+import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from code.helper import load_symptom_index
+
+TRANSLATION_PATH = 'translation.json'
+
+# Everyday wording -> symptom column; entries whose target is not in the vocabulary are skipped
+LAY_TERMS = {
+    'itchy': 'itching',
+    'rash': 'skin_rash',
+    'sneezing': 'continuous_sneezing',
+    'shivers': 'shivering',
+    'tired': 'fatigue',
+    'tiredness': 'fatigue',
+    'exhausted': 'fatigue',
+    'throwing up': 'vomiting',
+    'puking': 'vomiting',
+    'sick to stomach': 'nausea',
+    'queasy': 'nausea',
+    'heartburn': 'acidity',
+    'tummy ache': 'stomach_pain',
+    'stomach ache': 'stomach_pain',
+    'temperature': 'high_fever',
+    'fever': 'high_fever',
+    'feverish': 'mild_fever',
+    'coughing': 'cough',
+    'breathless': 'breathlessness',
+    'short of breath': 'breathlessness',
+    'out of breath': 'breathlessness',
+    'yellow skin': 'yellowish_skin',
+    'jaundice': 'yellowing_of_eyes',
+    'yellow eyes': 'yellowing_of_eyes',
+    'dizzy': 'dizziness',
+    'light headed': 'dizziness',
+    'head ache': 'headache',
+    'migraine': 'headache',
+    'blocked nose': 'congestion',
+    'stuffy nose': 'congestion',
+    'sore throat': 'throat_irritation',
+    'peeing a lot': 'polyuria',
+    'frequent urination': 'polyuria',
+    'burning pee': 'burning_micturition',
+    'losing weight': 'weight_loss',
+    'no appetite': 'loss_of_appetite',
+    'not hungry': 'loss_of_appetite',
+    'very thirsty': 'dehydration',
+    'loose motion': 'diarrhoea',
+    'diarrhea': 'diarrhoea',
+    'constipated': 'constipation',
+    'palpitations': 'fast_heart_rate',
+    'racing heart': 'fast_heart_rate',
+    'joint ache': 'joint_pain',
+    'body ache': 'muscle_pain',
+}
+
+# Tamil wording -> symptom column; translation.json only holds UI sentences, so
+# the symptom vocabulary gets its own table
+TAMIL_TERMS = {
+    'அரிப்பு': 'itching',
+    'தோல் தடிப்பு': 'skin_rash',
+    'தும்மல்': 'continuous_sneezing',
+    'நடுக்கம்': 'shivering',
+    'குளிர் நடுக்கம்': 'chills',
+    'மூட்டு வலி': 'joint_pain',
+    'வயிற்று வலி': 'stomach_pain',
+    'நெஞ்செரிச்சல்': 'acidity',
+    'வாந்தி': 'vomiting',
+    'குமட்டல்': 'nausea',
+    'சோர்வு': 'fatigue',
+    'களைப்பு': 'fatigue',
+    'எடை அதிகரிப்பு': 'weight_gain',
+    'எடை இழப்பு': 'weight_loss',
+    'பதட்டம்': 'anxiety',
+    'காய்ச்சல்': 'high_fever',
+    'லேசான காய்ச்சல்': 'mild_fever',
+    'இருமல்': 'cough',
+    'மூச்சுத் திணறல்': 'breathlessness',
+    'வியர்வை': 'sweating',
+    'நீரிழப்பு': 'dehydration',
+    'அஜீரணம்': 'indigestion',
+    'தலைவலி': 'headache',
+    'மஞ்சள் காமாலை': 'yellowish_skin',
+    'கண்கள் மஞ்சளாதல்': 'yellowing_of_eyes',
+    'பசியின்மை': 'loss_of_appetite',
+    'முதுகு வலி': 'back_pain',
+    'கழுத்து வலி': 'neck_pain',
+    'மலச்சிக்கல்': 'constipation',
+    'வயிற்றுப்போக்கு': 'diarrhoea',
+    'தலைச்சுற்றல்': 'dizziness',
+    'நெஞ்சு வலி': 'chest_pain',
+    'படபடப்பு': 'fast_heart_rate',
+    'தசை வலி': 'muscle_pain',
+    'மூக்கு ஒழுகுதல்': 'runny_nose',
+    'மூக்கடைப்பு': 'congestion',
+    'தொண்டை எரிச்சல்': 'throat_irritation',
+    'மங்கலான பார்வை': 'blurred_and_distorted_vision',
+    'அடிக்கடி சிறுநீர் கழித்தல்': 'polyuria',
+    'சிறுநீர் எரிச்சல்': 'burning_micturition',
+}
+
+
+def normalize(text):
+    text = unicodedata.normalize('NFKC', str(text)).lower().replace('_', ' ')
+    return ' '.join(text.split())
+
+
+def _deletes(token):
+    return {token[:i] + token[i + 1:] for i in range(len(token))}
+
+
+class SymptomSearchIndex:
+    '''
+    Search over the symptom vocabulary, built once per process:
+    - prefix matches on any word of a symptom or alias ("yell" -> yellowish_skin)
+    - one-typo tolerance through a delete-neighbourhood map ("feaver" -> fever)
+    - lay-term and Tamil aliases mapped onto the model's column names
+    Every lookup is a handful of dict probes and one bisect per query word.
+    '''
+
+    def __init__(self, symptoms, aliases=None):
+        self.symptoms = sorted(symptoms)
+        self.token_symptoms = {}
+        for symptom in self.symptoms:
+            self._add_term(normalize(symptom), symptom)
+        for alias, symptom in (aliases or {}).items():
+            if symptom in symptoms:
+                self._add_term(normalize(alias), symptom)
+
+        self.tokens = sorted(self.token_symptoms)
+        self.delete_map = {}
+        for token in self.tokens:
+            if len(token) >= 4:
+                for variant in _deletes(token) | {token}:
+                    self.delete_map.setdefault(variant, set()).add(token)
+
+    def _add_term(self, term, symptom):
+        for token in term.split():
+            self.token_symptoms.setdefault(token, set()).add(symptom)
+
+    def _prefix_tokens(self, prefix):
+        i = bisect_left(self.tokens, prefix)
+        while i < len(self.tokens) and self.tokens[i].startswith(prefix):
+            yield self.tokens[i]
+            i += 1
+
+    def _match_token(self, query_token):
+        '''symptom -> best score for one query word (exact 3, prefix 2, typo 1)'''
+        scores = {}
+        for token in self._prefix_tokens(query_token):
+            score = 3 if token == query_token else 2
+            for symptom in self.token_symptoms[token]:
+                scores[symptom] = max(scores.get(symptom, 0), score)
+        if len(query_token) >= 4:
+            for variant in _deletes(query_token) | {query_token}:
+                for token in self.delete_map.get(variant, ()):
+                    for symptom in self.token_symptoms[token]:
+                        scores.setdefault(symptom, 1)
+        return scores
+
+    def search(self, query, limit=20):
+        '''Symptom names matching every word of the query, best matches first'''
+        words = normalize(query).split()
+        if not words:
+            return self.symptoms[:limit] if limit else list(self.symptoms)
+
+        totals = None
+        for word in words:
+            scores = self._match_token(word)
+            if totals is None:
+                totals = scores
+            else:
+                totals = {s: totals[s] + scores[s] for s in totals.keys() & scores.keys()}
+            if not totals:
+                return []
+        ranked = sorted(totals, key=lambda s: (-totals[s], s))
+        return ranked[:limit] if limit else ranked
+
+
+def load_aliases(symptoms, translation_path=TRANSLATION_PATH):
+    '''
+    Lay terms and Tamil terms, plus any Tamil translation of a symptom's display
+    name that translation.json may gain later
+    '''
+    aliases = dict(LAY_TERMS)
+    aliases.update(TAMIL_TERMS)
+    try:
+        with open(translation_path, 'r', encoding='utf-8') as f:
+            translations = json.load(f)
+    except (OSError, ValueError):
+        return aliases
+    for symptom in symptoms:
+        display = symptom.replace('_', ' ').strip()
+        for key in (display, display.capitalize(), display.title()):
+            tamil = translations.get(key, {}).get('Tamil')
+            if tamil:
+                aliases[tamil] = symptom
+                break
+    return aliases
+
+
+@lru_cache(maxsize=None)
+def load_symptom_search_index():
+    symptoms = load_symptom_index().symptoms
+    return SymptomSearchIndex(symptoms, load_aliases(symptoms))
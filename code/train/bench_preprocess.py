@@ -0,0 +1,91 @@
+"""
+Compare scan preprocessing before and after the draft-mode / uint8 path.
+
+    python -m code.train.bench_preprocess                 # synthetic 12MP JPEG
+    python -m code.train.bench_preprocess --image scan.jpg --runs 20
+
+Each variant runs in a fresh process so its peak RSS is not inflated by the other.
+"""
+import argparse
+import io
+import multiprocessing
+import resource
+import time
+import numpy as np
+from PIL import Image
+from code.image_classifier import preprocess_image
+
+def legacy_preprocess(image_bytes, size):
+    # What imagerecognise did before: full decode, float32 copy, then a second copy for / 255
+    image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+    image = image.resize(size)
+    img_array = np.asarray(image, dtype=np.float32)
+    img_array = np.expand_dims(img_array, axis=0)
+    return img_array / 255.0
+
+def synthetic_jpeg(width=4000, height=3000):
+    # Smooth gradients with noise compress like a photo rather than a flat colour
+    rng = np.random.default_rng(0)
+    y, x = np.mgrid[0:height, 0:width]
+    pixels = np.stack([x * 255 // width, y * 255 // height, (x + y) * 255 // (width + height)], axis=-1)
+    pixels = np.clip(pixels + rng.integers(-20, 20, pixels.shape), 0, 255).astype(np.uint8)
+    buf = io.BytesIO()
+    Image.fromarray(pixels).save(buf, format="JPEG", quality=90)
+    return buf.getvalue()
+
+def _peak_rss_mb():
+    # VmHWM belongs to this process image; ru_maxrss would carry over the parent's peak across exec
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _worker(variant, image_bytes, size, runs, queue):
+    if variant == "legacy":
+        preprocess = lambda data: legacy_preprocess(data, size)
+    else:
+        preprocess = lambda data: preprocess_image(data, size)
+    baseline = _peak_rss_mb()
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        preprocess(image_bytes)
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    queue.put({"p50_ms": timings[len(timings) // 2], "peak_mb": _peak_rss_mb() - baseline})
+
+def run_variant(variant, image_bytes, size, runs):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    worker = ctx.Process(target=_worker, args=(variant, image_bytes, size, runs, queue))
+    worker.start()
+    stats = queue.get()
+    worker.join()
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--image", help="JPEG to benchmark (a synthetic 4000x3000 JPEG if omitted)")
+    parser.add_argument("--size", type=int, default=150, help="model input size in pixels")
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.image:
+        with open(args.image, "rb") as f:
+            image_bytes = f.read()
+    else:
+        image_bytes = synthetic_jpeg()
+    width, height = Image.open(io.BytesIO(image_bytes)).size
+    size = (args.size, args.size)
+    print(f"input {width}x{height} ({width * height / 1e6:.1f} MP, {len(image_bytes) / 1e6:.1f} MB) -> {size}")
+    print(f"{'variant':<8} {'p50 ms':>8} {'peak MB':>8}")
+    for variant in ("legacy", "draft"):
+        stats = run_variant(variant, image_bytes, size, args.runs)
+        print(f"{variant:<8} {stats['p50_ms']:>8.1f} {stats['peak_mb']:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Build the symptom co-occurrence graph used for "related symptoms" suggestions.
+
+    python -m code.train.build_symptom_graph --top-n 10
+
+Reads the symptom/disease training matrix once, computes positive pointwise mutual
+information between every pair of symptoms from the sparse co-occurrence counts,
+and keeps each symptom's top-N neighbours in models/symptom_neighbors.json.
+"""
+import argparse
+import json
+import os
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from code.helper import DATASET_PATH
+from code.symptom_graph import GRAPH_PATH
+
+def build_graph(dataset_path=DATASET_PATH, top_n=10, min_count=2):
+    df = pd.read_csv(dataset_path, sep='\t')
+    symptoms = df.columns[:-1].tolist()
+    X = csr_matrix(df.iloc[:, :-1].to_numpy(dtype=np.float32) > 0, dtype=np.float32)
+
+    n_rows = X.shape[0]
+    counts = np.asarray(X.sum(axis=0)).ravel()
+    co = (X.T @ X).tocoo()
+
+    neighbours = {symptom: [] for symptom in symptoms}
+    mask = (co.row != co.col) & (co.data >= min_count)
+    rows, cols, together = co.row[mask], co.col[mask], co.data[mask]
+    # PMI = log(P(a, b) / (P(a) P(b))); only positive associations are useful suggestions
+    pmi = np.log(together * n_rows / (counts[rows] * counts[cols]))
+    for a, b, score in zip(rows, cols, pmi):
+        if score > 0:
+            neighbours[symptoms[a]].append((symptoms[b], float(score)))
+
+    return {
+        symptom: [[b, round(score, 4)] for b, score in sorted(pairs, key=lambda p: -p[1])[:top_n]]
+        for symptom, pairs in neighbours.items()
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--min-count", type=int, default=2, help="ignore pairs seen together fewer times")
+    parser.add_argument("--output", default=GRAPH_PATH)
+    args = parser.parse_args()
+
+    graph = build_graph(args.dataset, args.top_n, args.min_count)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(graph, f)
+    edges = sum(len(v) for v in graph.values())
+    print(f"Wrote {args.output}: {len(graph)} symptoms, {edges} neighbour links")
+
+if __name__ == "__main__":
+    main()
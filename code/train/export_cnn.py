@@ -0,0 +1,220 @@
+"""
+Export the lung and kidney CNNs to lightweight CPU runtimes and check them against Keras.
+
+    python -m code.train.export_cnn export                     # writes models/*.tflite and models/*.onnx
+    python -m code.train.export_cnn parity --images data/scans # max |diff| and label agreement vs Keras
+    python -m code.train.export_cnn benchmark --images data/scans
+    python -m code.train.export_cnn quantize --calibration data/calibration
+    python -m code.train.export_cnn report --images data/holdout   # float32 vs float16 vs int8
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+import numpy as np
+from code.image_classifier import preprocess_image
+from code.runtime import ENGINE_SUFFIXES, PRECISIONS, load_model_file, model_path
+
+# Model name -> artifact stem
+CNN_MODELS = {
+    "lung_cancer": "models/lungcnn",
+    "kidney_mri": "models/kidn",
+}
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png"}
+
+def load_keras(stem):
+    import tensorflow as tf
+    return tf.keras.models.load_model(model_path(stem, "keras"))
+
+def export_tflite(keras_model, path):
+    import tensorflow as tf
+    converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+    Path(path).write_bytes(converter.convert())
+
+def export_onnx(keras_model, path):
+    import tensorflow as tf
+    import tf2onnx
+    spec = (tf.TensorSpec((None,) + tuple(keras_model.input_shape[1:]), tf.float32, name="input"),)
+    tf2onnx.convert.from_keras(keras_model, input_signature=spec, output_path=path)
+
+def export_quantized(keras_model, path, precision, calibration_images=None):
+    import tensorflow as tf
+    converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    if precision == "float16":
+        converter.target_spec.supported_types = [tf.float16]
+    elif precision == "int8":
+        # Full-integer kernels; inputs and outputs stay float32 so imagerecognise is unchanged
+        def representative_dataset():
+            for image in calibration_images:
+                yield [image[None]]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    Path(path).write_bytes(converter.convert())
+
+def load_images(folder, size, limit=64):
+    """Preprocess scans the same way imagerecognise does; random inputs if no folder is given"""
+    if folder:
+        files = sorted(p for p in Path(folder).rglob("*") if p.suffix.lower() in IMAGE_SUFFIXES)[:limit]
+        if files:
+            return np.stack([preprocess_image(p.read_bytes(), size) for p in files])
+    rng = np.random.default_rng(0)
+    return rng.random((min(limit, 16),) + size[::-1] + (3,), dtype=np.float32)
+
+def input_size(keras_model):
+    height, width = keras_model.input_shape[1:3]
+    return (width, height)
+
+def cmd_export(args):
+    for name, stem in CNN_MODELS.items():
+        keras_model = load_keras(stem)
+        for engine in args.engines:
+            path = model_path(stem, engine)
+            if engine == "tflite":
+                export_tflite(keras_model, path)
+            elif engine == "onnx":
+                export_onnx(keras_model, path)
+            print(f"{name}: wrote {path}")
+
+def cmd_parity(args):
+    failed = False
+    for name, stem in CNN_MODELS.items():
+        keras_model = load_keras(stem)
+        images = load_images(args.images, input_size(keras_model))
+        expected = keras_model.predict(images, verbose=0)
+        for engine in args.engines:
+            runtime_model = load_model_file(model_path(stem, engine))
+            actual = np.concatenate([runtime_model.predict(images[i:i + 1]) for i in range(len(images))])
+            max_diff = float(np.max(np.abs(actual - expected)))
+            agreement = float(np.mean(actual.argmax(axis=1) == expected.argmax(axis=1)))
+            ok = max_diff <= args.atol and agreement == 1.0
+            failed |= not ok
+            print(f"{name} [{engine}] images={len(images)} max|diff|={max_diff:.2e} "
+                  f"label agreement={agreement:.2%} {'OK' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+def _rss_mb():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _benchmark_worker(path, images, runs, queue):
+    # Runs in a fresh process so load time and RSS include importing the runtime
+    rss_before = _rss_mb()
+    start = time.perf_counter()
+    runtime_model = load_model_file(path)
+    load_s = time.perf_counter() - start
+    runtime_model.predict(images[:1])  # first call pays graph tracing / allocation
+    latencies = []
+    for i in range(runs):
+        image = images[i % len(images)][None]
+        start = time.perf_counter()
+        runtime_model.predict(image)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    queue.put({
+        "load_s": load_s,
+        "rss_mb": _rss_mb() - rss_before,
+        "p50_ms": latencies[len(latencies) // 2],
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+    })
+
+def benchmark_file(path, images, runs):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    worker = ctx.Process(target=_benchmark_worker, args=(path, images, runs, queue))
+    worker.start()
+    stats = queue.get()
+    worker.join()
+    return stats
+
+def cmd_benchmark(args):
+    print(f"{'model':<12} {'engine':<7} {'load s':>8} {'RSS MB':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, stem in CNN_MODELS.items():
+        keras_model = load_keras(stem)
+        images = load_images(args.images, input_size(keras_model))
+        del keras_model
+        for engine in ["keras"] + args.engines:
+            path = model_path(stem, engine)
+            if not os.path.exists(path):
+                print(f"{name:<12} {engine:<7} missing {path}")
+                continue
+            stats = benchmark_file(path, images, args.runs)
+            print(f"{name:<12} {engine:<7} {stats['load_s']:>8.2f} {stats['rss_mb']:>8.1f} "
+                  f"{stats['p50_ms']:>8.2f} {stats['p99_ms']:>8.2f}")
+
+def cmd_quantize(args):
+    for name, stem in CNN_MODELS.items():
+        keras_model = load_keras(stem)
+        calibration = load_images(args.calibration, input_size(keras_model), limit=args.samples)
+        for precision in args.precisions:
+            path = model_path(stem, "tflite", precision)
+            export_quantized(keras_model, path, precision, calibration)
+            print(f"{name}: wrote {path} ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+def cmd_report(args):
+    print(f"{'model':<12} {'variant':<9} {'size MB':>8} {'agree':>7} {'load s':>8} "
+          f"{'RSS MB':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for name, stem in CNN_MODELS.items():
+        keras_model = load_keras(stem)
+        images = load_images(args.images, input_size(keras_model), limit=args.samples)
+        expected = keras_model.predict(images, verbose=0).argmax(axis=1)
+        del keras_model
+        variants = [("float32", model_path(stem, "keras"))]
+        variants += [(p, model_path(stem, "tflite", p)) for p in PRECISIONS if p != "float32"]
+        for variant, path in variants:
+            if not os.path.exists(path):
+                print(f"{name:<12} {variant:<9} missing {path}")
+                continue
+            runtime_model = load_model_file(path)
+            labels = np.concatenate([runtime_model.predict(images[i:i + 1]) for i in range(len(images))]).argmax(axis=1)
+            agreement = float(np.mean(labels == expected))
+            del runtime_model
+            stats = benchmark_file(path, images, args.runs)
+            print(f"{name:<12} {variant:<9} {os.path.getsize(path) / 1e6:>8.1f} {agreement:>7.1%} "
+                  f"{stats['load_s']:>8.2f} {stats['rss_mb']:>8.1f} {stats['p50_ms']:>8.2f} {stats['p99_ms']:>8.2f}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    engines = [e for e in ENGINE_SUFFIXES if e != "keras"]
+
+    export = sub.add_parser("export", help="convert the Keras CNNs")
+    export.add_argument("--engines", nargs="+", choices=engines, default=engines)
+
+    parity = sub.add_parser("parity", help="compare exported models with Keras")
+    parity.add_argument("--images", help="folder of sample scans (random inputs if omitted)")
+    parity.add_argument("--engines", nargs="+", choices=engines, default=engines)
+    parity.add_argument("--atol", type=float, default=1e-4)
+
+    bench = sub.add_parser("benchmark", help="load time, RSS and latency per engine")
+    bench.add_argument("--images", help="folder of sample scans (random inputs if omitted)")
+    bench.add_argument("--engines", nargs="+", choices=engines, default=engines)
+    bench.add_argument("--runs", type=int, default=200)
+
+    quantized = [p for p in PRECISIONS if p != "float32"]
+    quantize = sub.add_parser("quantize", help="post-training float16 / int8 TFLite variants")
+    quantize.add_argument("--calibration", help="folder of calibration scans for int8 (random inputs if omitted)")
+    quantize.add_argument("--precisions", nargs="+", choices=quantized, default=quantized)
+    quantize.add_argument("--samples", type=int, default=200)
+
+    report = sub.add_parser("report", help="label agreement, load time, RSS and latency per precision")
+    report.add_argument("--images", help="held-out folder of scans (random inputs if omitted)")
+    report.add_argument("--samples", type=int, default=500)
+    report.add_argument("--runs", type=int, default=200)
+
+    args = parser.parse_args()
+    commands = {"export": cmd_export, "parity": cmd_parity, "benchmark": cmd_benchmark,
+                "quantize": cmd_quantize, "report": cmd_report}
+    sys.exit(commands[args.command](args) or 0)
+
+if __name__ == "__main__":
+    main()
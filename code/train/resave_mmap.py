@@ -0,0 +1,26 @@
+"""
+Re-save the tabular models uncompressed so joblib can memory-map their arrays.
+
+    python -m code.train.resave_mmap
+
+The registry loads models/mmap/<name>.joblib with mmap_mode="r" when present, so
+every Streamlit process on the host shares one read-only copy of the weights.
+A copy older than its original is ignored; re-run this after retraining.
+"""
+import os
+import joblib
+from config import settings
+from core.models import MMAP_MODELS, MODEL_SPECS
+
+def main():
+    os.makedirs(settings.MMAP_DIR, exist_ok=True)
+    for name in MMAP_MODELS:
+        loader, path = MODEL_SPECS[name]
+        model = loader(path)
+        target = os.path.join(settings.MMAP_DIR, f"{name}.joblib")
+        # compress=0 keeps each numpy buffer contiguous on disk, which mmap_mode requires
+        joblib.dump(model, target, compress=0)
+        print(f"{name}: {path} -> {target} ({os.path.getsize(target) / 1e6:.2f} MB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import os
+
+# Runtime settings for model serving, overridable through environment variables
+
+# Base URL of the shared inference server, e.g. "http://127.0.0.1:8765".
+# Leave empty to run every model in-process (local stand-in mode).
+INFERENCE_SERVER_URL = os.environ.get("INFERENCE_SERVER_URL", "")
+INFERENCE_HOST = os.environ.get("INFERENCE_HOST", "127.0.0.1")
+INFERENCE_PORT = int(os.environ.get("INFERENCE_PORT", "8765"))
+INFERENCE_TIMEOUT = float(os.environ.get("INFERENCE_TIMEOUT", "30"))
+
+# Dynamic micro-batching for the lung and kidney CNNs
+IMAGE_BATCHING = os.environ.get("IMAGE_BATCHING", "1") == "1"
+IMAGE_BATCH_MAX_SIZE = int(os.environ.get("IMAGE_BATCH_MAX_SIZE", "16"))
+IMAGE_BATCH_WINDOW_MS = float(os.environ.get("IMAGE_BATCH_WINDOW_MS", "10"))
+
+# Preprocessed-tensor cache for repeated scan uploads (0 disables)
+IMAGE_TENSOR_CACHE_SIZE = int(os.environ.get("IMAGE_TENSOR_CACHE_SIZE", "0"))
+
+# Content-hash cache of scan results (label, confidence, thumbnail); set
+# SCAN_CACHE_DIR to also keep them on disk across restarts
+SCAN_CACHE_SIZE = int(os.environ.get("SCAN_CACHE_SIZE", "512"))
+SCAN_CACHE_DIR = os.environ.get("SCAN_CACHE_DIR", "")
+SCAN_CACHE_DISK_SIZE = int(os.environ.get("SCAN_CACHE_DISK_SIZE", "10000"))
+
+# Report-resolution copies of uploaded scans referenced from session state by handle;
+# kept in memory, or under SCAN_STORE_DIR when set
+SCAN_STORE_SIZE = int(os.environ.get("SCAN_STORE_SIZE", "256"))
+SCAN_STORE_DIR = os.environ.get("SCAN_STORE_DIR", "")
+# Show what the current session holds in memory in the sidebar
+SESSION_MEMORY_REPORT = os.environ.get("SESSION_MEMORY_REPORT", "0") == "1"
+
+# Input-keyed cache for tabular and disease predictions
+PREDICTION_CACHE_SIZE = int(os.environ.get("PREDICTION_CACHE_SIZE", "4096"))
+PREDICTION_CACHE_TTL = float(os.environ.get("PREDICTION_CACHE_TTL", "3600"))
+PREDICTION_CACHE_MAX_ROWS = int(os.environ.get("PREDICTION_CACHE_MAX_ROWS", "64"))
+
+# Runtime used for the lung and kidney CNNs: keras (.h5), tflite or onnx.
+# Export the lightweight formats with: python -m code.train.export_cnn export
+CNN_ENGINE = os.environ.get("CNN_ENGINE", "keras")
+# float32, or a quantized variant (float16 / int8) from export_cnn quantize; requires CNN_ENGINE=tflite
+CNN_PRECISION = os.environ.get("CNN_PRECISION", "float32")
+
+# Models loaded and exercised once at boot; comma-separated names, "none" to skip warm-up
+WARMUP_MODELS = os.environ.get(
+    "WARMUP_MODELS", "diabetes,heart,kidney,liver,hypertension,disease,kidney_mri,lung_cancer")
+# Port for the /ready endpoint of the Streamlit process (0 disables it)
+READINESS_PORT = int(os.environ.get("READINESS_PORT", "0"))
+
+# Directory of memory-mappable tabular models written by code/train/resave_mmap.py ("" disables)
+MMAP_DIR = os.environ.get("MMAP_DIR", "models/mmap")
+
+# SQLite file holding each user's append-only symptom log
+SYMPTOM_DB_PATH = os.environ.get("SYMPTOM_DB_PATH", "data/symptom_log.db")
+
+# Number of differential diagnoses returned by the disease model
+DISEASE_TOP_K = int(os.environ.get("DISEASE_TOP_K", "5"))
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+from core.encoding import model_columns, model_category_maps, named_feature_models, positive_labels
+from core.inference_client import get_client
+
+DEFAULT_CHUNK_SIZE = 5000
+
+def _encode_column(values, mapping):
+    # Accept either the labels shown in the UI ("Above Normal") or their encoded value (2)
+    encoded = values.map(mapping)
+    numeric = pd.to_numeric(values, errors="coerce")
+    numeric = numeric.where(numeric.isin(list(mapping.values())))
+    return encoded.fillna(numeric)
+
+def encode_rows(model_name, df):
+    """
+    Validate and encode a DataFrame of raw rows for one model.
+    Returns (encoded features, boolean mask of valid rows, per-row error text).
+    """
+    if model_name not in model_columns:
+        raise KeyError(f"Unknown model: {model_name}")
+    columns = model_columns[model_name]
+    missing = [col for col in columns if col not in df.columns]
+    if missing:
+        raise ValueError(f"Missing columns for {model_name}: {missing}")
+
+    category_map = model_category_maps[model_name]
+    encoded = pd.DataFrame(index=df.index)
+    for col in columns:
+        if col in category_map:
+            encoded[col] = _encode_column(df[col], category_map[col])
+        else:
+            encoded[col] = pd.to_numeric(df[col], errors="coerce")
+
+    invalid = encoded.isna()
+    valid = ~invalid.any(axis=1)
+    errors = pd.Series("", index=df.index)
+    if not valid.all():
+        bad_cols = invalid.loc[~valid].apply(lambda row: ", ".join(row.index[row]), axis=1)
+        errors.loc[~valid] = "Invalid or missing: " + bad_cols
+    return encoded, valid, errors
+
+def _score(model_name, encoded):
+    X = encoded if model_name in named_feature_models else encoded.to_numpy()
+    result = get_client().predict(model_name, X)
+    predictions = np.asarray(result["predictions"])
+    if "probabilities" in result:
+        probabilities = np.asarray(result["probabilities"])
+        classes = list(result["classes"])
+        class_idx = np.array([classes.index(p) for p in predictions])
+        confidence = probabilities[np.arange(len(predictions)), class_idx]
+    else:
+        confidence = np.full(len(predictions), np.nan)
+    return predictions, confidence
+
+def predict_batch(model_name, rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Score many patients with one model. rows may be a DataFrame, a list of dicts,
+    or an iterable of DataFrame chunks (e.g. pd.read_csv(..., chunksize=n)).
+    Yields one result DataFrame per chunk so memory stays bounded.
+    """
+    if isinstance(rows, list):
+        rows = pd.DataFrame(rows)
+    if isinstance(rows, pd.DataFrame):
+        chunks = (rows.iloc[i:i + chunk_size] for i in range(0, len(rows), chunk_size))
+    else:
+        chunks = rows
+
+    for chunk in chunks:
+        encoded, valid, errors = encode_rows(model_name, chunk)
+        result = chunk.copy()
+        result["prediction"] = None
+        result["probability"] = np.nan
+        if valid.any():
+            predictions, confidence = _score(model_name, encoded.loc[valid])
+            result.loc[valid, "prediction"] = predictions
+            result.loc[valid, "probability"] = confidence
+        # Readable outcome, since the positive class differs between models
+        result["outcome"] = ""
+        result.loc[valid, "outcome"] = np.where(
+            result.loc[valid, "prediction"] == positive_labels[model_name], "positive", "negative")
+        result["error"] = errors
+        yield result
+
+def predict_csv(model_name, source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Stream a CSV file (path or file-like) through predict_batch"""
+    return predict_batch(model_name, pd.read_csv(source, chunksize=chunk_size), chunk_size)
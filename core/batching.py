@@ -0,0 +1,108 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+import numpy as np
+
+class MicroBatcher:
+    """
+    Collects concurrent predict calls for a short window and runs them as one
+    batched forward pass. Each caller blocks until its own slice of the output is ready.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=16, max_wait_ms=10, latency_window=1000):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_window)
+        self._batch_sizes = deque(maxlen=latency_window)
+        self._requests = 0
+        self._batches = 0
+
+    def _ensure_worker(self):
+        if self._thread is None:
+            with self._start_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+    def submit(self, inputs):
+        """Queue an input batch (usually one image) and wait for its predictions"""
+        self._ensure_worker()
+        future = Future()
+        self._queue.put((inputs, future, time.perf_counter()))
+        return future.result()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        size = len(batch[0][0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch, size
+
+    def _run(self):
+        while True:
+            batch, size = self._collect()
+            try:
+                outputs = self.predict_fn(np.concatenate([item[0] for item in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            done = time.perf_counter()
+            offset = 0
+            for inputs, future, queued_at in batch:
+                future.set_result(outputs[offset:offset + len(inputs)])
+                offset += len(inputs)
+                with self._stats_lock:
+                    self._latencies.append(done - queued_at)
+            with self._stats_lock:
+                self._batch_sizes.append(size)
+                self._requests += len(batch)
+                self._batches += 1
+
+    def metrics(self):
+        with self._stats_lock:
+            latencies = sorted(self._latencies)
+            batch_sizes = list(self._batch_sizes)
+            requests, batches = self._requests, self._batches
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+        return {
+            "queue_depth": self._queue.qsize(),
+            "requests": requests,
+            "batches": batches,
+            "avg_batch_size": sum(batch_sizes) / len(batch_sizes) if batch_sizes else 0,
+            "max_batch_size": max(batch_sizes) if batch_sizes else 0,
+            "latency_p50_ms": percentile(0.50),
+            "latency_p99_ms": percentile(0.99),
+        }
+
+class BatchedModel:
+    """Drop-in for a Keras model in imagerecognise: predict() goes through a MicroBatcher"""
+
+    def __init__(self, model, max_batch_size=16, max_wait_ms=10):
+        self.model = model
+        self.batcher = MicroBatcher(model.predict, max_batch_size, max_wait_ms)
+
+    def predict(self, inputs):
+        return self.batcher.submit(inputs)
@@ -0,0 +1,78 @@
+# Categorical encodings shared by the prediction pages and batch screening
+
+kidney_category_map = {
+    'red_blood_cells': {'normal': 0, 'abnormal': 1},
+    'pus_cell': {'normal': 0, 'abnormal': 1},
+    'pus_cell_clumps': {'notpresent': 0, 'present': 1},
+    'bacteria': {'notpresent': 0, 'present': 1},
+    'hypertension': {'no': 0, 'yes': 1},
+    'diabetes_mellitus': {'no': 0, 'yes': 1},
+    'coronary_artery_disease': {'no': 0, 'yes': 1},
+    'appetite': {'poor': 0, 'good': 1},
+    'pedal_edema': {'no': 0, 'yes': 1},
+    'anemia': {'no': 0, 'yes': 1}
+}
+
+# Heart: cholesterol / glucose levels and yes-no habits
+level_map = {"Normal": 1, "Above Normal": 2, "Well Above Normal": 3}
+yes_no_map = {"No": 0, "Yes": 1}
+sex_map = {"Male": 0, "Female": 1}  # heart gender and liver sex use the same coding
+
+heart_category_map = {
+    "gender": sex_map,
+    "cholesterol": level_map,
+    "gluc": level_map,
+    "smoke": yes_no_map,
+    "alco": yes_no_map,
+    "active": yes_no_map,
+}
+
+liver_category_map = {"sex": sex_map}
+
+hypertension_category_map = {
+    "gender": {"Male": 1, "Female": 0, "Other": 2},
+    "heart_disease": {"Yes": 1, "No": 0},
+    "ever_married": {"Yes": 1, "No": 0},
+    "work_type": {"Private": 2, "Self-employed": 3, "Govt_job": 0, "children": 1, "Never_worked": 4},
+    "Residence_type": {"Urban": 1, "Rural": 0},
+    "smoking_status": {"never smoked": 2, "formerly smoked": 1, "smokes": 3, "Unknown": 0},
+}
+
+# Feature columns in the order each model was trained on
+model_columns = {
+    "heart": ["age", "gender", "height", "weight", "ap_hi", "ap_lo",
+              "cholesterol", "gluc", "smoke", "alco", "active"],
+    "diabetes": ["Pregnancies", "Glucose", "BloodPressure", "SkinThickness",
+                 "Insulin", "BMI", "DiabetesPedigreeFunction", "Age"],
+    "kidney": ["age", "blood_pressure", "specific_gravity", "albumin", "sugar",
+               "red_blood_cells", "pus_cell", "pus_cell_clumps", "bacteria",
+               "blood_glucose_random", "blood_urea", "serum_creatinine", "sodium",
+               "potassium", "hemoglobin", "packed_cell_volume", "white_blood_cell_count",
+               "red_blood_cell_count", "hypertension", "diabetes_mellitus",
+               "coronary_artery_disease", "appetite", "pedal_edema", "anemia"],
+    "liver": ["sex", "age", "Total_Bilirubin", "Direct_Bilirubin", "Alkaline_Phosphotase",
+              "Alamine_Aminotransferase", "Aspartate_Aminotransferase", "Total_Protiens",
+              "Albumin", "Albumin_and_Globulin_Ratio"],
+    "hypertension": ["gender", "age", "heart_disease", "ever_married", "work_type",
+                     "Residence_type", "avg_glucose_level", "bmi", "smoking_status"],
+}
+
+# Prediction value that means the condition is present (kidney and liver do not use 1)
+positive_labels = {
+    "heart": 1,
+    "diabetes": 1,
+    "kidney": 0,
+    "liver": 2,
+    "hypertension": 1,
+}
+
+model_category_maps = {
+    "heart": heart_category_map,
+    "diabetes": {},
+    "kidney": kidney_category_map,
+    "liver": liver_category_map,
+    "hypertension": hypertension_category_map,
+}
+
+# Models that were fitted on named DataFrame columns rather than plain arrays
+named_feature_models = {"diabetes", "kidney", "hypertension"}
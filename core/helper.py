@@ -3,10 +3,12 @@ import pandas as pd
 import re
 import json
 import io
+import hashlib
+import numpy as np
 import matplotlib.pyplot as plt
-from collections import Counter
-from PIL import Image
+from matplotlib.lines import Line2D
 from googletrans import Translator
+from core.pattern_engine import PatternEngine, summarize_log
 
 COMMON_ILLNESS_PATTERNS = {
     'Common Cold': {
@@ -86,6 +88,9 @@ COMMON_ILLNESS_PATTERNS = {
     }
 }
 
+# Built once; scores every pattern in a single vectorized pass
+pattern_engine = PatternEngine(COMMON_ILLNESS_PATTERNS)
+
 strength_label = ["Very Weak", "Weak", "Moderate", "Strong", "Very Strong"]
 bar_color = ["#FF4B4B", "#FF884B", "#FFD93D", "#2ECC71", "#27AE60"]
 
@@ -262,137 +267,63 @@ def analyze_symptom_patterns(symptom_log):
     """
     if symptom_log.empty:
         return []
-    
-    # Convert dates from string to datetime if needed
-    if isinstance(symptom_log['Date'].iloc[0], str):
-        symptom_log['Date'] = pd.to_datetime(symptom_log['Date'])
-    
-    # Sort by date
-    symptom_log = symptom_log.sort_values('Date')
-    
-    # Get unique dates to calculate duration
-    unique_dates = symptom_log['Date'].unique()
-    duration_days = (max(unique_dates) - min(unique_dates)).days + 1
-    
-    # Get list of all symptoms and their severities
-    all_symptoms = symptom_log['Symptom'].tolist()
-    symptom_count = Counter(all_symptoms)
-    
-    # Count severity levels
-    severity_counts = Counter(symptom_log['Severity'].tolist())
-    
-    # Calculate the frequency of symptoms over time for progression analysis
-    symptom_progression = {}
-    for symptom in set(all_symptoms):
-        symptom_dates = symptom_log[symptom_log['Symptom'] == symptom]['Date'].tolist()
-        symptom_progression[symptom] = symptom_dates
-    
-    # Analyze matches with known patterns
-    matches = []
-    
-    for illness, pattern in COMMON_ILLNESS_PATTERNS.items():
-        # Calculate how many symptoms match
-        matching_symptoms = [s for s in pattern['symptoms'] if s in symptom_count]
-        symptom_match_ratio = len(matching_symptoms) / len(pattern['symptoms'])
-        
-        # Check if minimum number of symptoms are present
-        if len(matching_symptoms) < pattern['min_symptoms']:
-            continue
-            
-        # Check duration match (if we have enough data points)
-        if len(unique_dates) > 1:
-            min_duration, max_duration = pattern['typical_duration']
-            duration_match = min_duration <= duration_days <= max_duration
-            # Calculate how well the duration matches
-            if duration_days < min_duration:
-                duration_score = duration_days / min_duration
-            elif duration_days > max_duration:
-                duration_score = max_duration / duration_days
-            else:
-                duration_score = 1.0
-        else:
-            # Not enough data points to determine duration
-            duration_score = 0.5  # Neutral score
-            duration_match = None
-            
-        # Check severity pattern match
-        severity_match_score = 0
-        expected_total = sum(pattern['severity_pattern'].values())
-        if expected_total > 0:
-            for severity, expected_count in pattern['severity_pattern'].items():
-                actual_count = severity_counts.get(severity, 0)
-                # Calculate proportion of expected vs actual
-                if expected_count > 0:
-                    severity_match_score += min(actual_count / expected_count, 1.0) * (expected_count / expected_total)
-        else:
-            severity_match_score = 0.5  # Neutral score
-            
-        # Calculate overall confidence score (weighted average)
-        confidence = (
-            symptom_match_ratio * 0.60 +  # Symptom matching is most important
-            duration_score * 0.25 +        # Duration is somewhat important
-            severity_match_score * 0.15    # Severity pattern is least important
-        ) * 100  # Convert to percentage
-            
-        if confidence >= 40:  # Only include somewhat confident matches
-            matches.append({
-                'illness': illness,
-                'confidence': confidence,
-                'matching_symptoms': matching_symptoms,
-                'missing_symptoms': [s for s in pattern['symptoms'] if s not in symptom_count],
-                'duration_match': duration_match,
-                'description': pattern['description'],
-                'recommendations': pattern['recommendations']
-            })
-    
-    # Sort by confidence (highest first)
-    matches.sort(key=lambda x: x['confidence'], reverse=True)
-    return matches
+    return pattern_engine.match(*summarize_log(symptom_log))
 
-def get_symptom_progression_chart(symptom_log):
-    """Generate a chart showing symptom progression over time using matplotlib"""
-    if symptom_log.empty:
-        return None
+def symptom_log_version(symptom_log):
+    """Content hash of the plotted columns; changes whenever an entry is added or edited"""
+    hashed = pd.util.hash_pandas_object(symptom_log[['Date', 'Symptom', 'Severity']], index=False)
+    return hashlib.sha256(hashed.to_numpy().tobytes()).hexdigest()
 
-    # Convert date column to datetime
-    symptom_log['Date'] = pd.to_datetime(symptom_log['Date'])
+# Rendered once per log version; _symptom_log is not hashed by Streamlit, the version stands in for it
+@st.cache_data(max_entries=256)
+def _render_symptom_progression(log_version, _symptom_log):
+    dates = pd.to_datetime(_symptom_log['Date'])
 
     # Map severity to numeric values for visualization
     severity_map = {'Mild': 1, 'Moderate': 2, 'Severe': 3}
-    symptom_log['SeverityValue'] = symptom_log['Severity'].map(severity_map)
+    sizes = _symptom_log['Severity'].map(severity_map).to_numpy(dtype=float) * 60  # Size by severity
 
-    # Create a pivot for plotting
-    fig, ax = plt.subplots(figsize=(10, 5))
-
-    # Plot each symptom individually
-    for symptom in symptom_log['Symptom'].unique():
-        symptom_data = symptom_log[symptom_log['Symptom'] == symptom]
-        ax.scatter(symptom_data['Date'], [symptom] * len(symptom_data), 
-                   s=symptom_data['SeverityValue'] * 60,  # Size by severity
-                   label=symptom,
-                   alpha=0.6,
-                   edgecolors='k')
+    # One scatter call: symptoms become row positions, in order of first appearance
+    codes, symptoms = pd.factorize(_symptom_log['Symptom'])
+    palette = np.array(plt.rcParams['axes.prop_cycle'].by_key()['color'])
+    colors = palette[codes % len(palette)]
 
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.scatter(dates, codes, s=sizes, c=colors, alpha=0.6, edgecolors='k')
+    ax.set_yticks(range(len(symptoms)))
+    ax.set_yticklabels(symptoms)
+    ax.set_ylim(-0.5, len(symptoms) - 0.5)
+
+    handles = [Line2D([], [], marker='o', linestyle='', markersize=8, alpha=0.6,
+                      markerfacecolor=palette[i % len(palette)], markeredgecolor='k', label=symptom)
+               for i, symptom in enumerate(symptoms)]
     ax.set_title("Symptom Progression Over Time")
     ax.set_xlabel("Date")
     ax.set_ylabel("Symptom")
     ax.grid(True)
-    ax.legend(loc="upper right", bbox_to_anchor=(1.15, 1.0))
-    plt.tight_layout()
+    ax.legend(handles=handles, loc="upper right", bbox_to_anchor=(1.15, 1.0))
+    fig.tight_layout()
 
-    # Convert to image to display in Streamlit
     buf = io.BytesIO()
-    plt.savefig(buf, format="png")
-    buf.seek(0)
-    img = Image.open(buf)
-
+    fig.savefig(buf, format="png")
     # Clear the figure to avoid Streamlit duplication
     plt.close(fig)
+    return buf.getvalue()
 
-    return img
+def get_symptom_progression_chart(symptom_log):
+    """
+    PNG bytes of a chart showing symptom progression over time. Cached by the
+    log's content hash, and the caller's DataFrame is left unchanged.
+    """
+    if symptom_log.empty:
+        return None
+    return _render_symptom_progression(symptom_log_version(symptom_log), symptom_log)
 
-def analyze_and_display_patterns(symptom_log):
-    """Analyze symptom patterns and display results in the Streamlit app"""
+def analyze_and_display_patterns(symptom_log, matches=None):
+    """
+    Analyze symptom patterns and display results in the Streamlit app.
+    Pass matches when they are already known to skip re-analysis.
+    """
     st.subheader("🔍 Pattern Recognition Analysis")
     
     if symptom_log.empty:
@@ -405,7 +336,8 @@ def analyze_and_display_patterns(symptom_log):
         st.image(chart, use_container_width=True)
     
     # Get pattern matches
-    matches = analyze_symptom_patterns(symptom_log)
+    if matches is None:
+        matches = analyze_symptom_patterns(symptom_log)
     
     if not matches:
         st.info("No clear illness patterns detected from the logged symptoms. Continue tracking for better analysis.")
@@ -0,0 +1,150 @@
+import threading
+import numpy as np
+import pandas as pd
+from config import settings
+from core.batching import BatchedModel
+from core.models import registry
+from core.prediction_cache import PredictionCache, feature_key
+from core.scan_cache import ScanCache, make_thumbnail, scan_key
+from code.image_classifier import ImageClassifier
+
+TABULAR_MODELS = ("diabetes", "heart", "kidney", "liver", "hypertension")
+
+# Imaging model name -> label file and input size
+IMAGE_MODELS = {
+    "lung_cancer": {"label_path": "models/lung_labels.txt", "input_size": (150, 150)},
+    "kidney_mri": {"label_path": "models/kidney_labels.txt", "input_size": (150, 150)},
+}
+
+prediction_cache = PredictionCache(settings.PREDICTION_CACHE_SIZE, settings.PREDICTION_CACHE_TTL)
+# Preprocessed scan tensors keyed by content hash; off unless IMAGE_TENSOR_CACHE_SIZE is set
+tensor_cache = (PredictionCache(settings.IMAGE_TENSOR_CACHE_SIZE, settings.PREDICTION_CACHE_TTL)
+                if settings.IMAGE_TENSOR_CACHE_SIZE > 0 else None)
+# Scan results keyed by upload bytes and model version, so re-uploads skip the CNN
+scan_cache = ScanCache(settings.SCAN_CACHE_SIZE, settings.SCAN_CACHE_DIR or None, settings.SCAN_CACHE_DISK_SIZE)
+
+_batched_models = {}
+_batched_lock = threading.Lock()
+
+def _image_model(model_name):
+    model = registry.get(model_name)
+    if not settings.IMAGE_BATCHING:
+        return model
+    # One batching queue per CNN, shared by every session in this process
+    with _batched_lock:
+        if model_name not in _batched_models:
+            _batched_models[model_name] = BatchedModel(
+                model, settings.IMAGE_BATCH_MAX_SIZE, settings.IMAGE_BATCH_WINDOW_MS)
+        return _batched_models[model_name]
+
+_classifiers = {}
+
+def _image_classifier(model_name):
+    if model_name not in IMAGE_MODELS:
+        raise KeyError(f"Unknown image model: {model_name}")
+    classifier = _classifiers.get(model_name)
+    if classifier is None:
+        classifier = ImageClassifier(_image_model(model_name), cache=tensor_cache, **IMAGE_MODELS[model_name])
+        _classifiers[model_name] = classifier
+    return classifier
+
+def _as_model_input(rows):
+    if isinstance(rows, (pd.DataFrame, np.ndarray)):
+        return rows
+    # Rows given as dicts keep their column names (kidney, diabetes, hypertension);
+    # plain lists are passed through positionally (heart, liver)
+    if rows and isinstance(rows[0], dict):
+        return pd.DataFrame(rows)
+    return rows
+
+def predict(model_name, rows):
+    """Score encoded feature rows with one of the tabular models or the disease model"""
+    if model_name == "disease":
+        # Symptom order does not change the feature vector
+        rows = [sorted(symptoms) for symptoms in rows]
+        compute = lambda: _predict_disease(rows)
+    elif model_name in TABULAR_MODELS:
+        compute = lambda: _predict_tabular(model_name, rows)
+    else:
+        raise KeyError(f"Unknown model: {model_name}")
+
+    # Large batch jobs would only churn the cache, so they are scored directly
+    if len(rows) > settings.PREDICTION_CACHE_MAX_ROWS:
+        return compute()
+    key = feature_key(model_name, registry.version(model_name), rows)
+    return prediction_cache.get_or_compute(key, compute)
+
+def _predict_tabular(model_name, rows):
+    model = registry.get(model_name)
+    X = _as_model_input(rows)
+    result = {"predictions": model.predict(X).tolist()}
+    if hasattr(model, "predict_proba"):
+        result["probabilities"] = model.predict_proba(X).tolist()
+        result["classes"] = model.classes_.tolist()
+    return result
+
+def _predict_disease(symptom_lists):
+    # All symptom sets go through the booster in one pass
+    top_k = registry.get("disease").predict_topk(symptom_lists, k=settings.DISEASE_TOP_K)
+    return {
+        "predictions": [ranked[0][0] for ranked in top_k],
+        "probabilities": [ranked[0][1] for ranked in top_k],
+        "top_k": [[list(pair) for pair in ranked] for ranked in top_k],
+    }
+
+def _scan_version(model_name):
+    # Only stats the artifact, so cache hits never load the CNN
+    if model_name not in IMAGE_MODELS:
+        raise KeyError(f"Unknown image model: {model_name}")
+    return registry.version(model_name)
+
+def classify_image(model_name, image_bytes, use_cache=True):
+    """Run one of the imaging CNNs on an uploaded scan"""
+    if not use_cache:
+        label, confidence = _image_classifier(model_name).classify(image_bytes)
+        return {"label": label, "confidence": confidence, "scan_id": None}
+    key = scan_key(model_name, _scan_version(model_name), image_bytes)
+    entry = scan_cache.get(key)
+    if entry is None:
+        label, confidence = _image_classifier(model_name).classify(image_bytes)
+        entry = scan_cache.put(key, label, confidence, make_thumbnail(image_bytes))
+    return {"label": entry["label"], "confidence": entry["confidence"], "scan_id": key}
+
+def scan_thumbnail(scan_id):
+    """Downscaled JPEG of a classified scan, or None once it has left the cache"""
+    entry = scan_cache.get(scan_id)
+    return entry["thumbnail"] if entry is not None else None
+
+def classify_images(model_name, images):
+    """Classify several scans; only the ones not already cached go through one model call"""
+    version = _scan_version(model_name)
+    keys = [scan_key(model_name, version, image_bytes) for image_bytes in images]
+    entries = [scan_cache.get(key) for key in keys]
+    missing = [i for i, entry in enumerate(entries) if entry is None]
+    results = _image_classifier(model_name).classify_batch([images[i] for i in missing]) if missing else []
+    for i, (label, confidence) in zip(missing, results):
+        entries[i] = scan_cache.put(keys[i], label, confidence, make_thumbnail(images[i]))
+    return [{"label": entry["label"], "confidence": entry["confidence"], "scan_id": key}
+            for key, entry in zip(keys, entries)]
+
+def describe(model_name):
+    """Model metadata the pages display (parameters, coefficients, version)"""
+    model = registry.get(model_name)
+    info = {"version": registry.version(model_name)}
+    if hasattr(model, "get_params"):
+        info["params"] = {k: v if isinstance(v, (str, int, float, bool, type(None))) else str(v)
+                          for k, v in model.get_params().items()}
+    if hasattr(model, "coef_"):
+        info["coef"] = model.coef_[0].tolist()
+    return info
+
+def metrics():
+    return {
+        "batching": {name: batched.batcher.metrics() for name, batched in _batched_models.items()},
+        "prediction_cache": prediction_cache.stats(),
+        "tensor_cache": tensor_cache.stats() if tensor_cache is not None else None,
+        "scan_cache": scan_cache.stats(),
+    }
+
+def model_names():
+    return list(TABULAR_MODELS) + ["disease"] + list(IMAGE_MODELS)
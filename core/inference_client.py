@@ -0,0 +1,82 @@
+import json
+import requests
+from config import settings
+from code.image_classifier import ImageTooLargeError
+
+class LocalInferenceClient:
+    """Stand-in that runs the models inside the current process"""
+
+    def predict(self, model_name, rows):
+        from core import inference
+        return inference.predict(model_name, rows)
+
+    def classify_image(self, model_name, image_bytes):
+        from core import inference
+        return inference.classify_image(model_name, image_bytes)
+
+    def describe(self, model_name):
+        from core import inference
+        return inference.describe(model_name)
+
+    def metrics(self):
+        from core import inference
+        return inference.metrics()
+
+def _json_default(value):
+    # DataFrames, numpy scalars and arrays
+    if hasattr(value, "to_dict"):
+        return value.to_dict("records")
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+class HttpInferenceClient:
+    """Thin client for core.inference_server"""
+
+    def __init__(self, base_url, timeout=settings.INFERENCE_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+
+    def _call(self, method, path, **kwargs):
+        response = self.session.request(method, f"{self.base_url}{path}", timeout=self.timeout, **kwargs)
+        if response.status_code != 200:
+            # A proxy or crashed server may answer with HTML or an empty body
+            try:
+                error = response.json().get("error")
+            except (ValueError, AttributeError):
+                error = None
+            if response.status_code == 413:
+                raise ImageTooLargeError(error or "Image too large")
+            raise RuntimeError(error or f"Inference server returned {response.status_code} {response.reason}")
+        try:
+            return response.json()
+        except ValueError:
+            raise RuntimeError(f"Inference server returned invalid JSON for {path}")
+
+    def predict(self, model_name, rows):
+        body = json.dumps({"rows": rows}, default=_json_default)
+        return self._call("POST", f"/predict/{model_name}", data=body,
+                          headers={"Content-Type": "application/json"})
+
+    def classify_image(self, model_name, image_bytes):
+        return self._call("POST", f"/classify_image/{model_name}", data=image_bytes,
+                          headers={"Content-Type": "application/octet-stream"})
+
+    def describe(self, model_name):
+        return self._call("GET", f"/models/{model_name}")
+
+    def metrics(self):
+        return self._call("GET", "/metrics")
+
+_client = None
+
+def get_client():
+    """Client for the configured backend: the shared server if INFERENCE_SERVER_URL is set, else in-process"""
+    global _client
+    if _client is None:
+        if settings.INFERENCE_SERVER_URL:
+            _client = HttpInferenceClient(settings.INFERENCE_SERVER_URL)
+        else:
+            _client = LocalInferenceClient()
+    return _client
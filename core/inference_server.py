@@ -0,0 +1,95 @@
+import argparse
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from config import settings
+from core import inference, warmup
+from code.image_classifier import ImageTooLargeError
+
+# Routes:
+#   POST /predict/<model>         JSON {"rows": [...]}  -> predictions (+ probabilities)
+#   POST /classify_image/<model>  raw image bytes       -> label, confidence
+#   GET  /models/<model>          model metadata
+#   GET  /metrics                 batching and prediction cache statistics
+#   GET  /health
+#   GET  /ready                   200 once the configured models are warm, 503 before
+
+class InferenceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return self.rfile.read(length)
+
+    def _route(self):
+        parts = self.path.strip("/").split("/")
+        return parts[0], (parts[1] if len(parts) > 1 else None)
+
+    def do_GET(self):
+        action, model_name = self._route()
+        try:
+            if action == "health":
+                self._send(200, {"status": "ok", "models": inference.model_names()})
+            elif action == "ready":
+                self._send(200 if warmup.is_ready() else 503, warmup.readiness())
+            elif action == "metrics":
+                self._send(200, inference.metrics())
+            elif action == "models" and model_name:
+                self._send(200, inference.describe(model_name))
+            else:
+                self._send(404, {"error": f"Unknown route: {self.path}"})
+        except KeyError as e:
+            self._send(404, {"error": e.args[0]})
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+
+    def do_POST(self):
+        action, model_name = self._route()
+        try:
+            body = self._read_body()
+            if action == "predict" and model_name:
+                rows = json.loads(body).get("rows", [])
+                self._send(200, inference.predict(model_name, rows))
+            elif action == "classify_image" and model_name:
+                self._send(200, inference.classify_image(model_name, body))
+            else:
+                self._send(404, {"error": f"Unknown route: {self.path}"})
+        except ImageTooLargeError as e:
+            self._send(413, {"error": str(e)})
+        except KeyError as e:
+            self._send(404, {"error": e.args[0]})
+        except Exception as e:
+            self._send(500, {"error": str(e)})
+
+    def log_message(self, format, *args):
+        pass
+
+def serve(host=settings.INFERENCE_HOST, port=settings.INFERENCE_PORT, warm=True):
+    server = ThreadingHTTPServer((host, port), InferenceHandler)
+    if warm:
+        warmup.start_warmup()
+    print(f"Inference server listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Shared model inference server for the Streamlit workers")
+    parser.add_argument("--host", default=settings.INFERENCE_HOST)
+    parser.add_argument("--port", type=int, default=settings.INFERENCE_PORT)
+    parser.add_argument("--no-warmup", action="store_true", help="skip loading models at boot")
+    args = parser.parse_args()
+    serve(args.host, args.port, warm=not args.no_warmup)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Preload-then-fork launcher for several Streamlit workers on one host.
+
+    python -m core.launcher --workers 4 --base-port 8501 --report
+
+The parent deserializes the tabular and disease models once, freezes the GC so
+reference-count updates do not dirty those pages, then forks one Streamlit
+server per port. Workers share the model pages copy-on-write. The imaging
+CNNs are left to each worker because TensorFlow does not survive fork.
+With READINESS_PORT set, worker i serves /ready on READINESS_PORT + i.
+"""
+import argparse
+import gc
+import os
+import signal
+import sys
+import time
+from config import settings
+from core import warmup
+from core.inference import IMAGE_MODELS
+from core.models import registry
+from core.memreport import memory_report
+from core.serve_app import run_app
+
+def preload():
+    """
+    Deserialize the non-imaging models without running them: a first XGBoost
+    prediction would start the OpenMP pool, and libgomp is not fork-safe.
+    Workers run the first-call inference after the fork.
+    """
+    loaded, errors = [], {}
+    for name in warmup.configured_models():
+        if name in IMAGE_MODELS:
+            continue
+        try:
+            registry.get(name)
+            loaded.append(name)
+        except Exception as e:
+            errors[name] = str(e)
+    return {"models": loaded, "errors": errors}
+
+def run_worker(port, script, readiness_port=0):
+    # The parent's warm-up state would otherwise report this worker ready before
+    # its own CNNs load; each worker warms up and serves its own /ready port
+    warmup.reset()
+    run_app(script, port, readiness_port)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--base-port", type=int, default=8501)
+    parser.add_argument("--script", default="app.py")
+    parser.add_argument("--report", action="store_true", help="print per-process shared vs unique memory")
+    parser.add_argument("--report-delay", type=float, default=30.0)
+    args = parser.parse_args()
+
+    status = preload()
+    print(f"Preloaded models: {status['models']}")
+    if status["errors"]:
+        print(f"Failed to preload: {status['errors']}")
+    if args.report:
+        print(memory_report([os.getpid()], title="Parent after preload"))
+
+    gc.collect()
+    gc.freeze()
+
+    children = []
+    for i in range(args.workers):
+        pid = os.fork()
+        if pid == 0:
+            run_worker(args.base_port + i, args.script,
+                       settings.READINESS_PORT + i if settings.READINESS_PORT else 0)
+            os._exit(0)
+        children.append(pid)
+        readiness = f", /ready on {settings.READINESS_PORT + i}" if settings.READINESS_PORT else ""
+        print(f"Worker {pid} on port {args.base_port + i}{readiness}")
+
+    def shutdown(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    if args.report:
+        time.sleep(args.report_delay)
+        mmap_state = "mmap" if settings.MMAP_DIR and os.path.isdir(settings.MMAP_DIR) else "no mmap"
+        print(memory_report([os.getpid()] + children, title=f"Parent and workers ({mmap_state})"))
+
+    for pid in children:
+        os.waitpid(pid, 0)
+
+if __name__ == "__main__":
+    main()
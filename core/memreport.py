@@ -0,0 +1,81 @@
+"""
+Per-process memory breakdown from /proc/<pid>/smaps_rollup (Linux), and an
+estimate of what one Streamlit session keeps in session state.
+
+    python -m core.memreport <pid> [<pid> ...]
+"""
+import sys
+
+FIELDS = ("Rss", "Pss", "Shared_Clean", "Shared_Dirty", "Private_Clean", "Private_Dirty")
+
+def process_memory(pid):
+    """Memory of one process in MB: rss, pss, shared and unique (private) pages"""
+    values = dict.fromkeys(FIELDS, 0)
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in values:
+                values[key] = int(rest.split()[0]) / 1024
+    return {
+        "pid": pid,
+        "rss_mb": values["Rss"],
+        "pss_mb": values["Pss"],
+        "shared_mb": values["Shared_Clean"] + values["Shared_Dirty"],
+        "unique_mb": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+def memory_report(pids, title=None):
+    lines = [title] if title else []
+    lines.append(f"{'pid':>8} {'RSS MB':>9} {'PSS MB':>9} {'shared MB':>10} {'unique MB':>10}")
+    total_unique = total_pss = 0
+    for pid in pids:
+        try:
+            mem = process_memory(pid)
+        except OSError:
+            lines.append(f"{pid:>8} unavailable")
+            continue
+        total_unique += mem["unique_mb"]
+        total_pss += mem["pss_mb"]
+        lines.append(f"{pid:>8} {mem['rss_mb']:>9.1f} {mem['pss_mb']:>9.1f} "
+                     f"{mem['shared_mb']:>10.1f} {mem['unique_mb']:>10.1f}")
+    lines.append(f"{'total':>8} {'':>9} {total_pss:>9.1f} {'':>10} {total_unique:>10.1f}")
+    return "\n".join(lines)
+
+def object_size(value, _seen=None):
+    """Approximate deep size in bytes of a session-state value"""
+    _seen = _seen if _seen is not None else set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    if hasattr(value, "memory_usage") and hasattr(value, "columns"):
+        return int(value.memory_usage(deep=True).sum())
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(object_size(k, _seen) + object_size(v, _seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(object_size(item, _seen) for item in value)
+    return size
+
+def session_memory(state, scan_store=None):
+    """(key, bytes) per session-state entry, largest first; scan handles include their stored copy"""
+    sizes = {}
+    for key in list(state.keys()):
+        value = state[key]
+        size = object_size(value)
+        if scan_store is not None and str(key).endswith("_image_handle"):
+            size += scan_store.nbytes(value)
+        sizes[str(key)] = size
+    return sorted(sizes.items(), key=lambda item: -item[1])
+
+def session_report(state, scan_store=None, limit=15):
+    entries = session_memory(state, scan_store)
+    lines = [f"{'key':<32} {'KB':>9}"]
+    for key, size in entries[:limit]:
+        lines.append(f"{key[:32]:<32} {size / 1024:>9.1f}")
+    lines.append(f"{'total':<32} {sum(size for _, size in entries) / 1024:>9.1f}")
+    return "\n".join(lines)
+
+if __name__ == "__main__":
+    print(memory_report([int(pid) for pid in sys.argv[1:]]))
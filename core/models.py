@@ -1,15 +1,119 @@
+import os
 import pickle
-import joblib 
-import tensorflow as tf
+import threading
+import joblib
+from config import settings
+from code.runtime import load_model_file, model_path
+
+
+def _load_pickle(path):
+    with open(path, "rb") as f:
+        return pickle.load(f)
+
+def _load_joblib(path):
+    return joblib.load(path)
+
+def _load_cnn(path):
+    # TensorFlow / the lightweight runtime is only imported when an imaging model is first requested
+    return load_model_file(path)
+
+def _load_disease(path):
+    from code.DiseaseModel import DiseaseModel
+    disease_model = DiseaseModel()
+    disease_model.load_xgboost(path)
+    return disease_model
+
+def _cnn_artifact(stem):
+    # Resolved when the model is first requested, so an invalid CNN_ENGINE /
+    # CNN_PRECISION combination only fails the imaging models
+    return lambda: model_path(stem, settings.CNN_ENGINE, settings.CNN_PRECISION)
+
+# Model name -> (loader, artifact path, or a callable returning it)
+MODEL_SPECS = {
+    "diabetes": (_load_joblib, "models/diabetes_model.pkl"),
+    "heart": (_load_pickle, "models/cardio_model_ML.pkl"),
+    "kidney": (_load_joblib, "models/kidney_disease_model.pkl"),
+    "kidney_mri": (_load_cnn, _cnn_artifact("models/kidn")),
+    "liver": (_load_joblib, "models/liver_model.sav"),
+    "hypertension": (_load_joblib, "models/hypertension_model.pkl"),
+    "mean_std": (_load_pickle, "models/mean_std_values.pkl"),
+    "lung_cancer": (_load_cnn, _cnn_artifact("models/lungcnn")),
+    "disease": (_load_disease, "models/xgboost_model.json"),
+}
+
+def _load_mmap(path):
+    # numpy arrays inside the model stay on disk and are paged in read-only, so
+    # forked workers and separate processes share the same physical pages
+    return joblib.load(path, mmap_mode="r")
+
+class ModelRegistry:
+    """Process-wide store that loads each model on first use and keeps one instance."""
+
+    def __init__(self, specs, mmap_dir=None):
+        self._specs = specs
+        self._mmap_dir = mmap_dir
+        self._models = {}
+        self._locks = {name: threading.Lock() for name in specs}
+
+    def artifact(self, name):
+        """
+        (loader, path) for a model, preferring a memory-mappable copy unless the
+        original artifact has been replaced since the copy was written
+        """
+        loader, path = self._specs[name]
+        if callable(path):
+            path = path()
+        if self._mmap_dir:
+            mmap_path = os.path.join(self._mmap_dir, f"{name}.joblib")
+            try:
+                mmap_mtime = os.stat(mmap_path).st_mtime_ns
+            except OSError:
+                mmap_mtime = None
+            if mmap_mtime is not None:
+                try:
+                    source_mtime = os.stat(path).st_mtime_ns
+                except OSError:
+                    source_mtime = 0
+                if mmap_mtime >= source_mtime:
+                    return _load_mmap, mmap_path
+        return loader, path
+
+    def get(self, name):
+        if name not in self._specs:
+            raise KeyError(f"Unknown model: {name}")
+        model = self._models.get(name)
+        if model is not None:
+            return model
+        # Per-model lock so two sessions never deserialize the same artifact twice
+        with self._locks[name]:
+            if name not in self._models:
+                loader, path = self.artifact(name)
+                self._models[name] = loader(path)
+            return self._models[name]
+
+    def version(self, name):
+        # Changes whenever the artifact on disk is replaced, so caches keyed on it expire
+        _, path = self.artifact(name)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return f"{name}:missing"
+        return f"{name}:{stat.st_mtime_ns}:{stat.st_size}"
+
+    def is_loaded(self, name):
+        return name in self._models
+
+    def loaded(self):
+        return list(self._models)
+
+    def names(self):
+        return list(self._specs)
+
+# Plain-array models that code/train/resave_mmap.py can re-save for mmap loading
+MMAP_MODELS = ("diabetes", "heart", "kidney", "liver", "hypertension", "mean_std")
+
+registry = ModelRegistry(MODEL_SPECS, settings.MMAP_DIR or None)
 
 def load_models():
-    return {
-        "diabetes": joblib.load(open("models/diabetes_model.pkl", "rb")),
-        "heart": pickle.load(open("models/cardio_model_ML.pkl", "rb")),
-        "kidney": joblib.load("models/kidney_disease_model.pkl"),
-        "kidney_mri":tf.keras.models.load_model("models/kidn.h5"),
-        "liver": joblib.load("models/liver_model.sav"),
-        "hypertension": joblib.load("models/hypertension_model.pkl"),
-        "mean_std": pickle.load(open("models/mean_std_values.pkl", "rb")),
-        "lung_cancer":tf.keras.models.load_model("models/lungcnn.h5")
-    }
+    # Kept for older callers; prefer registry.get(name) to load only what a page needs
+    return {name: registry.get(name) for name in registry.names()}
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+SEVERITIES = ('Mild', 'Moderate', 'Severe')
+
+# Weights of the overall confidence score
+SYMPTOM_WEIGHT = 0.60
+DURATION_WEIGHT = 0.25
+SEVERITY_WEIGHT = 0.15
+MIN_CONFIDENCE = 40
+
+
+def summarize_log(symptom_log):
+    """
+    Aggregates the pattern scores depend on: symptom counts, severity counts,
+    number of distinct dates and the span in days. Does not modify the log.
+    """
+    dates = pd.to_datetime(symptom_log['Date'])
+    symptom_counts = symptom_log['Symptom'].value_counts().to_dict()
+    severity_counts = symptom_log['Severity'].value_counts().to_dict()
+    duration_days = (dates.max() - dates.min()).days + 1
+    return symptom_counts, severity_counts, dates.nunique(), duration_days
+
+
+class PatternEngine:
+    """
+    Illness patterns as arrays: a patterns x symptoms binary matrix, minimum
+    symptom counts, duration bounds and expected severity counts, so every
+    pattern is scored in one NumPy pass
+    """
+
+    def __init__(self, patterns):
+        self.patterns = patterns
+        self.names = list(patterns)
+        self.symptoms = sorted({s for pattern in patterns.values() for s in pattern['symptoms']})
+        self.position = {symptom: i for i, symptom in enumerate(self.symptoms)}
+
+        self.matrix = np.zeros((len(self.names), len(self.symptoms)), dtype=bool)
+        for row, pattern in enumerate(patterns.values()):
+            self.matrix[row, [self.position[s] for s in pattern['symptoms']]] = True
+        self.pattern_sizes = np.array([len(p['symptoms']) for p in patterns.values()], dtype=float)
+        self.min_symptoms = np.array([p['min_symptoms'] for p in patterns.values()])
+        self.min_duration = np.array([p['typical_duration'][0] for p in patterns.values()], dtype=float)
+        self.max_duration = np.array([p['typical_duration'][1] for p in patterns.values()], dtype=float)
+        self.expected_severity = np.array(
+            [[p['severity_pattern'].get(s, 0) for s in SEVERITIES] for p in patterns.values()], dtype=float)
+        self.expected_total = self.expected_severity.sum(axis=1)
+
+    def present(self, symptom_counts):
+        """Boolean vector over the pattern vocabulary of symptoms seen at least once"""
+        present = np.zeros(len(self.symptoms), dtype=bool)
+        for symptom, count in symptom_counts.items():
+            if count and symptom in self.position:
+                present[self.position[symptom]] = True
+        return present
+
+    def matched_counts(self, present):
+        """Number of each pattern's symptoms that are present"""
+        return self.matrix @ present.astype(np.int64)
+
+    def score(self, matched, severity_counts, n_dates, duration_days):
+        """(confidence %, duration match) for every pattern, given its matched symptom count"""
+        symptom_ratio = matched / self.pattern_sizes
+
+        if n_dates > 1:
+            duration_score = np.where(
+                duration_days < self.min_duration, duration_days / self.min_duration,
+                np.where(duration_days > self.max_duration, self.max_duration / duration_days, 1.0))
+            duration_match = (self.min_duration <= duration_days) & (duration_days <= self.max_duration)
+        else:
+            # Not enough data points to determine duration
+            duration_score = np.full(len(self.names), 0.5)
+            duration_match = None
+
+        actual = np.array([severity_counts.get(s, 0) for s in SEVERITIES], dtype=float)
+        expected = self.expected_severity
+        with np.errstate(divide='ignore', invalid='ignore'):
+            parts = np.where(expected > 0,
+                             np.minimum(actual / expected, 1.0) * (expected / self.expected_total[:, None]),
+                             0.0)
+        severity_score = np.where(self.expected_total > 0, parts.sum(axis=1), 0.5)
+
+        confidence = (
+            symptom_ratio * SYMPTOM_WEIGHT +
+            duration_score * DURATION_WEIGHT +
+            severity_score * SEVERITY_WEIGHT
+        ) * 100
+        return confidence, duration_match
+
+    def match(self, symptom_counts, severity_counts, n_dates, duration_days):
+        """Patterns with enough matching symptoms and confidence, highest first"""
+        present = self.present(symptom_counts)
+        return self.match_present(present, self.matched_counts(present), severity_counts, n_dates, duration_days)
+
+    def match_present(self, present, matched, severity_counts, n_dates, duration_days):
+        confidence, duration_match = self.score(matched, severity_counts, n_dates, duration_days)
+        keep = np.flatnonzero((matched >= self.min_symptoms) & (confidence >= MIN_CONFIDENCE))
+        # Stable, so ties keep the pattern definition order
+        keep = keep[np.argsort(-confidence[keep], kind='stable')]
+
+        matches = []
+        for row in keep:
+            pattern = self.patterns[self.names[row]]
+            matches.append({
+                'illness': self.names[row],
+                'confidence': float(confidence[row]),
+                'matching_symptoms': [s for s in pattern['symptoms'] if present[self.position[s]]],
+                'missing_symptoms': [s for s in pattern['symptoms'] if not present[self.position[s]]],
+                'duration_match': bool(duration_match[row]) if duration_match is not None else None,
+                'description': pattern['description'],
+                'recommendations': pattern['recommendations']
+            })
+        return matches
+
+
+class IncrementalAnalyzer:
+    """
+    Running aggregates of a symptom log: symptom and severity counts, distinct
+    dates, first/last date and each pattern's matched symptom count. Adding an
+    entry is O(1), or O(patterns) the first time a symptom appears, and
+    matches() never rescans the log.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.n_entries = 0
+        self.symptom_counts = {}
+        self.severity_counts = {}
+        self.dates = set()
+        self.first_date = None
+        self.last_date = None
+        self.present = np.zeros(len(engine.symptoms), dtype=bool)
+        self.matched = np.zeros(len(engine.names), dtype=np.int64)
+        self._matches = None
+
+    def add(self, date, symptom, severity):
+        date = pd.Timestamp(date)
+        self.n_entries += 1
+        self.symptom_counts[symptom] = self.symptom_counts.get(symptom, 0) + 1
+        self.severity_counts[severity] = self.severity_counts.get(severity, 0) + 1
+        self.dates.add(date)
+        if self.first_date is None or date < self.first_date:
+            self.first_date = date
+        if self.last_date is None or date > self.last_date:
+            self.last_date = date
+        position = self.engine.position.get(symptom)
+        if position is not None and not self.present[position]:
+            self.present[position] = True
+            self.matched += self.engine.matrix[:, position]
+        self._matches = None
+
+    def sync(self, symptom_log):
+        """Consume rows appended to the log since the last call; rebuild if it was replaced by a shorter one"""
+        if len(symptom_log) < self.n_entries:
+            self.__init__(self.engine)
+        new_rows = symptom_log.iloc[self.n_entries:]
+        for date, symptom, severity in zip(new_rows['Date'], new_rows['Symptom'], new_rows['Severity']):
+            self.add(date, symptom, severity)
+        return self
+
+    def matches(self):
+        if self.n_entries == 0:
+            return []
+        if self._matches is None:
+            duration_days = (self.last_date - self.first_date).days + 1
+            self._matches = self.engine.match_present(
+                self.present, self.matched, self.severity_counts, len(self.dates), duration_days)
+        return self._matches
@@ -1,10 +1,9 @@
 import streamlit as st
-import io
 from fpdf import FPDF
-from PIL import Image
 from datetime import datetime
 from code.meal_planner import get_personalized_meal_plan
 from core.helper import t
+from core.scan_store import scan_store
 
 def clean_text_for_pdf(text):
     return text.encode('latin-1', 'ignore').decode('latin-1')
@@ -256,10 +255,12 @@ def generate_pdf():
             pdf.multi_cell(0, 10, result_text)
 
             # Add image if available
-            if "lung_image_bytes" in st.session_state:
-                image = Image.open(io.BytesIO(st.session_state["lung_image_bytes"]))
+            # Skipped if the stored copy has been evicted
+            image_bytes = scan_store.get(st.session_state.get("lung_image_handle"))
+            if image_bytes:
                 image_path = "temp_lung_image.jpg"
-                image.save(image_path)
+                with open(image_path, "wb") as f:
+                    f.write(image_bytes)
                 pdf.image(image_path, w=100)  # Adjust width as needed
                 pdf.ln(5)
 
@@ -298,10 +299,11 @@ def generate_pdf():
             result_text = f"Prediction: {label.capitalize()}\nConfidence: {confidence:.2f}%"
             pdf.multi_cell(0, 10, result_text)
             # Add image if available
-            if "kidney_ultrasound_image" in st.session_state:
-                image = Image.open(io.BytesIO(st.session_state['kidney_ultrasound_image']))
+            image_bytes = scan_store.get(st.session_state.get("kidney_image_handle"))
+            if image_bytes:
                 image_path = "temp_kidney_image.jpg"
-                image.save(image_path)
+                with open(image_path, "wb") as f:
+                    f.write(image_bytes)
                 pdf.image(image_path, w=100)  # Resize as needed
 
         if "liver_diagnosis" in st.session_state:
@@ -0,0 +1,133 @@
+import base64
+import hashlib
+import io
+import json
+import os
+import threading
+from PIL import Image
+from core.prediction_cache import PredictionCache
+
+THUMBNAIL_SIZE = (128, 128)
+
+def scan_key(model_name, model_version, image_bytes):
+    """Content hash of an upload, scoped to the model version that classified it"""
+    digest = hashlib.sha256(image_bytes).hexdigest()
+    return hashlib.sha256(f"{model_name}:{model_version}:{digest}".encode("utf-8")).hexdigest()
+
+def make_thumbnail(image_bytes, size=THUMBNAIL_SIZE):
+    image = Image.open(io.BytesIO(image_bytes))
+    image.draft("RGB", size)
+    image = image.convert("RGB")
+    image.thumbnail(size)
+    buf = io.BytesIO()
+    image.save(buf, format="JPEG", quality=80)
+    return buf.getvalue()
+
+def prune_directory(directory, suffix, maxsize):
+    """Delete the least recently written files beyond maxsize; returns how many are left"""
+    paths = [os.path.join(directory, name) for name in os.listdir(directory) if name.endswith(suffix)]
+    if len(paths) <= maxsize:
+        return len(paths)
+    def mtime(path):
+        try:
+            return os.stat(path).st_mtime
+        except OSError:
+            return 0
+    paths.sort(key=mtime)
+    for path in paths[:len(paths) - maxsize]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    return maxsize
+
+class DirectoryPruner:
+    """
+    Keeps a directory near maxsize files without listing it on every write: new
+    files are counted and the directory is only pruned once the count passes
+    maxsize by a tenth, so the listing cost is paid once per maxsize / 10 writes
+    """
+
+    def __init__(self, directory, suffix, maxsize):
+        self.directory = directory
+        self.suffix = suffix
+        self.maxsize = maxsize
+        self.slack = max(1, maxsize // 10)
+        self.count = None
+        self.lock = threading.Lock()
+
+    def added(self):
+        with self.lock:
+            if self.count is None:
+                self.count = sum(1 for name in os.listdir(self.directory) if name.endswith(self.suffix))
+            else:
+                self.count += 1
+            if self.count > self.maxsize + self.slack:
+                self.count = prune_directory(self.directory, self.suffix, self.maxsize)
+
+class ScanCache:
+    """
+    Classification results for uploaded scans: an in-memory LRU in front of an
+    optional directory of small JSON files that survives restarts, pruned to
+    disk_maxsize entries (plus a tenth of slack) by least recent use
+    """
+
+    def __init__(self, maxsize=512, disk_dir=None, disk_maxsize=10000):
+        self.memory = PredictionCache(maxsize, ttl=None)
+        self.disk_dir = disk_dir
+        self.disk_maxsize = disk_maxsize
+        self.disk_hits = 0
+        self._disk_lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._pruner = DirectoryPruner(disk_dir, ".json", disk_maxsize)
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _read_disk(self, key):
+        path = self._disk_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # a hit counts as recent use for pruning
+        except (OSError, ValueError):
+            return None
+        entry["thumbnail"] = base64.b64decode(entry["thumbnail"])
+        return entry
+
+    def _write_disk(self, key, entry):
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        stored = dict(entry, thumbnail=base64.b64encode(entry["thumbnail"]).decode("ascii"))
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(stored, f)
+        os.replace(tmp_path, path)  # readers never see a half-written entry
+        self._pruner.added()
+
+    def get(self, key):
+        entry = self.memory.get(key)
+        if entry is None and self.disk_dir:
+            entry = self._read_disk(key)
+            if entry is not None:
+                with self._disk_lock:
+                    self.disk_hits += 1
+                self.memory.put(key, entry)
+        return entry
+
+    def put(self, key, label, confidence, thumbnail):
+        entry = {"label": label, "confidence": confidence, "thumbnail": thumbnail}
+        self.memory.put(key, entry)
+        if self.disk_dir:
+            self._write_disk(key, entry)
+        return entry
+
+    def stats(self):
+        stats = self.memory.stats()
+        with self._disk_lock:
+            disk_hits = self.disk_hits
+        # A memory miss answered from disk still avoided running the CNN
+        lookups = stats["hits"] + stats["misses"]
+        stats.update(disk_hits=disk_hits, disk_dir=self.disk_dir,
+                     hit_rate=(stats["hits"] + disk_hits) / lookups if lookups else 0.0)
+        return stats
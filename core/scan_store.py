@@ -0,0 +1,79 @@
+import hashlib
+import io
+import os
+import threading
+from PIL import Image
+from config import settings
+from core.prediction_cache import PredictionCache
+from core.scan_cache import DirectoryPruner
+
+# Longest side of the copy kept for the PDF report (printed at about 100 mm wide)
+REPORT_SIZE = (800, 800)
+
+def report_copy(image_bytes, size=REPORT_SIZE, quality=85):
+    """Downscaled JPEG of an upload, small enough to keep around for the report"""
+    image = Image.open(io.BytesIO(image_bytes))
+    image.draft("RGB", size)
+    image = image.convert("RGB")
+    image.thumbnail(size)
+    buf = io.BytesIO()
+    image.save(buf, format="JPEG", quality=quality, optimize=True)
+    return buf.getvalue()
+
+class ScanStore:
+    """
+    Report-resolution copies of uploaded scans behind short handles, so session
+    state never holds image bytes. Kept in a bounded in-memory LRU, or in a
+    directory pruned back to the same number of files when disk_dir is set.
+    """
+
+    def __init__(self, maxsize=256, disk_dir=None, ttl=None):
+        self.maxsize = maxsize
+        self.disk_dir = disk_dir
+        self.memory = PredictionCache(maxsize, ttl)
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._pruner = DirectoryPruner(disk_dir, ".jpg", maxsize)
+
+    def _disk_path(self, handle):
+        return os.path.join(self.disk_dir, f"{handle}.jpg")
+
+    def put(self, image_bytes):
+        """Store a report copy of an upload and return its handle"""
+        handle = hashlib.sha256(image_bytes).hexdigest()[:32]
+        if self.disk_dir:
+            path = self._disk_path(handle)
+            if os.path.exists(path):
+                os.utime(path)
+            else:
+                tmp_path = f"{path}.{threading.get_ident()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(report_copy(image_bytes))
+                os.replace(tmp_path, path)
+                self._pruner.added()
+        elif self.memory.get(handle) is None:
+            self.memory.put(handle, report_copy(image_bytes))
+        return handle
+
+    def get(self, handle):
+        """JPEG bytes for a handle, or None once the copy has been evicted"""
+        if not handle:
+            return None
+        if self.disk_dir:
+            try:
+                with open(self._disk_path(handle), "rb") as f:
+                    return f.read()
+            except OSError:
+                return None
+        return self.memory.get(handle)
+
+    def nbytes(self, handle):
+        if self.disk_dir:
+            try:
+                return os.path.getsize(self._disk_path(handle))
+            except OSError:
+                return 0
+        data = self.memory.get(handle)
+        return len(data) if data is not None else 0
+
+scan_store = ScanStore(settings.SCAN_STORE_SIZE, settings.SCAN_STORE_DIR or None)
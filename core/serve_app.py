@@ -0,0 +1,37 @@
+"""
+Start the Streamlit app with warm-up and /ready running from process start.
+
+    python -m core.serve_app --port 8501
+
+`streamlit run app.py` only executes app.py when the first browser session
+connects, so in-process warm-up (and READINESS_PORT) would wait for a user.
+This entry point starts both before the Streamlit server accepts traffic.
+"""
+import argparse
+from config import settings
+from core import warmup
+
+def run_app(script="app.py", port=8501, readiness_port=None):
+    if readiness_port is not None:
+        settings.READINESS_PORT = readiness_port
+    # The inference server warms itself up; only in-process mode loads models here
+    if not settings.INFERENCE_SERVER_URL:
+        warmup.start_warmup()
+    from streamlit.web import bootstrap
+    # bootstrap.run only uses flag options to re-apply them on config changes;
+    # like the streamlit CLI, load them first
+    flag_options = {"server_port": port, "server_headless": True}
+    bootstrap.load_config_options(flag_options)
+    bootstrap.run(script, False, [], flag_options)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8501)
+    parser.add_argument("--script", default="app.py")
+    parser.add_argument("--readiness-port", type=int, default=None,
+                        help="serve GET /ready here (defaults to READINESS_PORT)")
+    args = parser.parse_args()
+    run_app(args.script, args.port, args.readiness_port)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+import os
+import sqlite3
+import threading
+import time
+import pandas as pd
+from config import settings
+
+COLUMNS = ["Date", "Symptom", "Severity", "Duration"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS symptom_log (
+    id INTEGER PRIMARY KEY,
+    user TEXT NOT NULL,
+    date TEXT NOT NULL,
+    symptom TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    duration TEXT,
+    logged_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_symptom_log_user_date_symptom ON symptom_log (user, date, symptom);
+"""
+
+def _iso_date(value):
+    return pd.Timestamp(value).date().isoformat()
+
+class SymptomLogStore:
+    """
+    Append-only symptom log per user in SQLite. Rows are never updated or
+    deleted; reads come back in insertion order as columnar DataFrames.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        # One connection for the process: Streamlit starts a new script thread on
+        # every rerun, so per-thread connections would be reopened constantly
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+
+    def append(self, user, entries):
+        """Write a batch of (date, symptom, severity, duration) rows in one transaction"""
+        logged_at = time.time()
+        rows = [(user, _iso_date(date), symptom, severity, duration, logged_at)
+                for date, symptom, severity, duration in entries]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO symptom_log (user, date, symptom, severity, duration, logged_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def query(self, user, start=None, end=None, symptoms=None):
+        """
+        Entries for a user, optionally within [start, end] and limited to some
+        symptoms, as a DataFrame with the tracker's columns
+        """
+        sql = "SELECT date, symptom, severity, duration FROM symptom_log WHERE user = ?"
+        params = [user]
+        if start is not None:
+            sql += " AND date >= ?"
+            params.append(_iso_date(start))
+        if end is not None:
+            sql += " AND date <= ?"
+            params.append(_iso_date(end))
+        if symptoms:
+            sql += f" AND symptom IN ({', '.join('?' * len(symptoms))})"
+            params.extend(symptoms)
+        sql += " ORDER BY id"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        columns = list(zip(*rows)) if rows else [()] * len(COLUMNS)
+        log = pd.DataFrame({name: list(values) for name, values in zip(COLUMNS, columns)}, columns=COLUMNS)
+        log["Date"] = pd.to_datetime(log["Date"])
+        return log
+
+    def count(self, user):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM symptom_log WHERE user = ?", (user,)).fetchone()[0]
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_symptom_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SymptomLogStore(settings.SYMPTOM_DB_PATH)
+        return _store
@@ -0,0 +1,95 @@
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from PIL import Image
+from config import settings
+from core import inference
+from core.encoding import model_columns, named_feature_models
+from core.models import registry
+
+_state = {"started": False, "ready": False, "timings": {}, "errors": {}}
+_lock = threading.Lock()
+
+def configured_models():
+    if settings.WARMUP_MODELS.strip().lower() == "none":
+        return []
+    return [name.strip() for name in settings.WARMUP_MODELS.split(",") if name.strip()]
+
+def _dummy_image():
+    buf = io.BytesIO()
+    Image.new("RGB", (256, 256), (128, 128, 128)).save(buf, format="PNG")
+    return buf.getvalue()
+
+def _first_call(name):
+    # Goes through the same path as the pages, so image preprocessing and
+    # the first-inference graph tracing are paid here rather than by a user.
+    # The scan cache is skipped: a disk hit from a previous run would leave the CNN unloaded
+    if name in inference.IMAGE_MODELS:
+        inference.classify_image(name, _dummy_image(), use_cache=False)
+    elif name == "disease":
+        inference.predict(name, [[registry.get("disease").all_symptoms[0]]])
+    elif name in model_columns:
+        columns = model_columns[name]
+        row = dict.fromkeys(columns, 0) if name in named_feature_models else [0] * len(columns)
+        inference.predict(name, [row])
+
+def warm_up(model_names=None):
+    """Load each configured model and run one dummy inference, recording the timings"""
+    _state["ready"] = False
+    for name in model_names if model_names is not None else configured_models():
+        try:
+            start = time.perf_counter()
+            registry.get(name)
+            loaded = time.perf_counter()
+            _first_call(name)
+            done = time.perf_counter()
+            _state["timings"][name] = {"load_s": round(loaded - start, 3),
+                                       "first_call_s": round(done - loaded, 3)}
+        except Exception as e:
+            _state["errors"][name] = str(e)
+    _state["ready"] = not _state["errors"]
+    return readiness()
+
+def reset():
+    """Forget warm-up state, e.g. in a worker forked from a process that already warmed up"""
+    with _lock:
+        _state.update(started=False, ready=False, timings={}, errors={})
+
+def start_warmup(model_names=None):
+    """Start warm-up once per process in a background thread"""
+    with _lock:
+        if _state["started"]:
+            return
+        _state["started"] = True
+    threading.Thread(target=warm_up, args=(model_names,), daemon=True).start()
+    if settings.READINESS_PORT:
+        start_readiness_server(settings.READINESS_PORT)
+
+def is_ready():
+    return _state["ready"]
+
+def readiness():
+    return {"ready": _state["ready"], "models": dict(_state["timings"]), "errors": dict(_state["errors"])}
+
+class ReadinessHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/ready":
+            self.send_error(404)
+            return
+        body = json.dumps(readiness()).encode("utf-8")
+        self.send_response(200 if is_ready() else 503)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_readiness_server(port, host="0.0.0.0"):
+    """Serve GET /ready (200 once warm, 503 before) so a load balancer can gate traffic"""
+    server = ThreadingHTTPServer((host, port), ReadinessHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,68 @@
+import io
+import streamlit as st
+import streamlit.components.v1 as components
+from core.batch import predict_csv, DEFAULT_CHUNK_SIZE
+from core.encoding import model_columns
+from core.helper import t
+
+model_labels = {
+    "Diabetes": "diabetes",
+    "Heart Disease": "heart",
+    "Kidney Disease": "kidney",
+    "Liver Disease": "liver",
+    "Hypertension": "hypertension",
+}
+
+def run():
+    page_title=t("📋 Batch Screening")
+    components.html(f"""
+        <style>
+            @keyframes fadeSlide {{
+                0% {{opacity: 0; transform: translateY(-10px);}}
+                100% {{opacity: 1; transform: translateY(0);}}
+            }}
+            #title {{
+                font-family: 'Segoe UI', sans-serif;
+                font-size: 3.5vw;
+                font-weight: bold;
+                text-align: center;
+                margin-top: 15px;
+                animation: fadeSlide 1s ease-out;
+                background: linear-gradient(90deg, #FF4081, #FFCDD2);
+                -webkit-background-clip: text;
+                color: inherit;
+                -webkit-text-fill-color: initial;
+            }}
+        </style>
+        <div id="title">{page_title}</div>
+    """, height=50)
+
+    st.write(t("Upload a clinic roster as CSV to score every patient with one model."))
+    model_label = st.selectbox(t("Model"), list(model_labels))
+    model_name = model_labels[model_label]
+
+    with st.expander(t("Required CSV columns")):
+        st.code(",".join(model_columns[model_name]))
+
+    uploaded_file = st.file_uploader(t("📤 Upload CSV"), type=["csv"])
+    if uploaded_file and st.button(t("🔍 Predict")):
+        output = io.StringIO()
+        total = invalid = positive = 0
+        status = st.empty()
+        try:
+            for i, chunk in enumerate(predict_csv(model_name, uploaded_file, DEFAULT_CHUNK_SIZE)):
+                chunk.to_csv(output, index=False, header=(i == 0))
+                total += len(chunk)
+                invalid += int((chunk["error"] != "").sum())
+                positive += int((chunk["outcome"] == "positive").sum())
+                status.info(f"{t('Rows scored')}: {total}")
+        except ValueError as e:
+            st.error(f"❌ {e}")
+            return
+
+        st.success(f"{t('Rows scored')}: {total}")
+        col1, col2 = st.columns(2)
+        col1.metric(t("Predicted positive"), positive)
+        col2.metric(t("Rows with errors"), invalid)
+        st.download_button(t("Download results"), output.getvalue(),
+                           file_name=f"{model_name}_predictions.csv", mime="text/csv")
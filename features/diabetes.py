@@ -2,12 +2,9 @@ import streamlit as st
 import pandas as pd
 import streamlit.components.v1 as components
 from code.meal_planner import get_personalized_meal_plan
-from core.models import load_models
+from core.inference_client import get_client
 from core.helper import t
 
-models=load_models()
-model_diabetes=models['diabetes']
-
 def validate_inputs(input_data):
     errors = []
 
@@ -159,7 +156,7 @@ def run():
                                         BMI, DiabetesPedigreeFunction, Age]],
                                     columns=["Pregnancies", "Glucose", "BloodPressure", "SkinThickness",
                                             "Insulin", "BMI", "DiabetesPedigreeFunction", "Age"])
-            prediction = model_diabetes.predict(input_data)[0]
+            prediction = get_client().predict("diabetes", input_data.to_dict("records"))["predictions"][0]
         
             # Validate inputs
             input_errors = validate_inputs(input_data)
@@ -1,15 +1,20 @@
 import streamlit as st
 import streamlit.components.v1 as components
-from pathlib import Path
-from code.DiseaseModel import DiseaseModel
-from code.helper import prepare_symptoms_array
 from core.helper import t
+from core.inference_client import get_client
+from code.symptom_search import load_symptom_search_index
+from code.knowledge_base import load_knowledge_base
+from code.symptom_graph import load_symptom_graph
+
+def add_symptom(symptom):
+    # Runs before the rerun, so the multiselect picks up the new value
+    st.session_state["disease_symptoms"] = st.session_state.get("disease_symptoms", []) + [symptom]
 
 def run():
-    # Initialize model
-    disease_model = DiseaseModel()
-    model_path = Path("models/xgboost_model.json")  # relative path (adjust if needed)
-    disease_model.load_xgboost(str(model_path))
+    # Symptom vocabulary and disease text are loaded once per process; scoring goes through the inference client
+    search_index = load_symptom_search_index()
+    knowledge_base = load_knowledge_base()
+    symptom_graph = load_symptom_graph()
     page_title=t("🧠 Disease Prediction using Machine Learning")
 
 
@@ -39,17 +44,30 @@ def run():
     st.markdown("""---""")
     st.subheader(t("🤒 Enter Your Symptoms Below"))
 
+    # Symptom search: prefix, typo-tolerant and lay-term / Tamil matches
+    query = st.text_input(t("Search symptoms"), placeholder=t("e.g. tired, yellow skin, feaver"))
+    selected = st.session_state.get("disease_symptoms", [])
+    matches = search_index.search(query, limit=None)
+    options = selected + [s for s in matches if s not in selected]
+
     # Symptom selection
     symptoms = st.multiselect(
         t("What are your symptoms?"),
-        options=sorted(disease_model.all_symptoms),
+        options=options,
+        format_func=lambda s: s.replace("_", " "),
         placeholder=t("Start typing to search for symptoms..."),
+        key="disease_symptoms",
     )
 
     st.session_state["symptoms_selected"] = symptoms
 
-    # Prepare input array
-    X = prepare_symptoms_array(symptoms)
+    # Related symptoms from the precomputed co-occurrence graph
+    related = symptom_graph.suggest(symptoms, limit=5)
+    if related:
+        st.caption(t("Related symptoms you may also have:"))
+        columns = st.columns(len(related))
+        for column, symptom in zip(columns, related):
+            column.button(symptom.replace("_", " "), key=f"related_{symptom}", on_click=add_symptom, args=(symptom,))
 
     # Predict Button
     st.markdown("""<div style='text-align: center;'>""", unsafe_allow_html=True)
@@ -58,28 +76,37 @@ def run():
 
     if predict_btn:
         try:
-            prediction, prob = disease_model.predict(X)
+            result = get_client().predict("disease", [symptoms])
+            prediction, prob = result["predictions"][0], result["probabilities"][0]
             prob_percent = f"{prob * 100:.2f}%"
 
             # Store in session
             st.session_state["general_disease_name"] = prediction
             st.session_state["general_disease_probability"] = prob_percent
-            st.session_state["disease_description"] = disease_model.describe_predicted_disease()
-            st.session_state["disease_precautions"] = disease_model.predicted_disease_precautions()
+            # The PDF report is Latin-1, so the session keeps the English text
+            info = knowledge_base.lookup(prediction) or {"description": "", "precautions": []}
+            st.session_state["disease_description"] = info["description"]
+            st.session_state["disease_precautions"] = info["precautions"]
+            localized = knowledge_base.lookup(prediction, st.session_state.get("language", "English")) or info
 
             # Output display
             st.markdown(f"## 🩺 {t('Predicted Disease')}: **{prediction}**")
             st.markdown(f"### 🎯 {t('Confidence')}: **{prob_percent}**")
 
+            differentials = result["top_k"][0][1:]
+            if differentials:
+                st.markdown(f"**{t('Other possible conditions')}:** " +
+                            ", ".join(f"{disease} ({p * 100:.1f}%)" for disease, p in differentials))
+
             tab1, tab2 = st.tabs([t("📖 Description"), t("🛡️ Precautions")])
 
             with tab1:
                 st.markdown("""<div style='padding: 10px; border-left: 4px solid #FF4081; background-color: #f9f9f9;'>""", unsafe_allow_html=True)
-                st.write(st.session_state["disease_description"])
+                st.write(localized["description"])
                 st.markdown("""</div>""", unsafe_allow_html=True)
 
             with tab2:
-                precautions = st.session_state["disease_precautions"]
+                precautions = localized["precautions"]
                 if precautions:
                     st.markdown("<ul>", unsafe_allow_html=True)
                     for i, p in enumerate(precautions[:4]):
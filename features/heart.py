@@ -1,12 +1,10 @@
 import pandas as pd
 import streamlit as st
 import streamlit.components.v1 as components
-from core.models import load_models
+from core.inference_client import get_client
+from core.encoding import level_map, sex_map, yes_no_map
 from core.helper import t
 
-models=load_models()
-classifier=models['heart']
-
 # Load nutrition database from CSV file
 @st.cache_data
 def load_nutrition_data():
@@ -399,18 +397,19 @@ def run():
         active = st.selectbox(t("Do you Exercise Regularly?"), ["No", "Yes"])
 
         # Encoding
-        gender_val = 0 if gender == "Male" else 1
-        cholesterol_val = 1 if chol == "Normal" else (2 if chol == "Above Normal" else 3)
-        gluc_val = 1 if gluc == "Normal" else (2 if gluc == "Above Normal" else 3)
-        smoke_val = 1 if smoke == "Yes" else 0
-        alco_val = 1 if alco == "Yes" else 0
-        active_val = 1 if active == "Yes" else 0
+        gender_val = sex_map[gender]
+        cholesterol_val = level_map[chol]
+        gluc_val = level_map[gluc]
+        smoke_val = yes_no_map[smoke]
+        alco_val = yes_no_map[alco]
+        active_val = yes_no_map[active]
 
         # Prediction
         if st.button(t("🔍 Predict")):
             with st.spinner(t("🧠 Predicting based on your health data...")):
-                prediction = classifier.predict([[age, gender_val, height, weight, ap_hi, ap_lo,
-                                                cholesterol_val, gluc_val, smoke_val, alco_val, active_val]])[0]
+                result = get_client().predict("heart", [[age, gender_val, height, weight, ap_hi, ap_lo,
+                                                cholesterol_val, gluc_val, smoke_val, alco_val, active_val]])
+                prediction = result["predictions"][0]
 
                 # Save results to session state
                 st.session_state["heart_diagnosis"] = prediction
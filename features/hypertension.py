@@ -1,9 +1,13 @@
+import io
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
 import matplotlib.pyplot as plt
 from core.helper import classify_blood_pressure, t
-from core.models import load_models
+from core.inference_client import get_client
+from core.encoding import hypertension_category_map, model_columns
+
+expected_order = model_columns["hypertension"]
 
 # New: Risk categorization based on model output
 def categorize_risk(prob):
@@ -14,6 +18,18 @@ def categorize_risk(prob):
     else:
         return "Low Risk", "🟢", "risk_advice_low"
 
+# Coefficient chart only depends on the model weights, so render it once per model version
+@st.cache_data
+def feature_importance_chart(model_version, importance, xlabel):
+    fig, ax = plt.subplots(figsize=(8, 4))
+    ax.barh(expected_order, importance, color="#FF4081")
+    ax.set_xlabel(xlabel)
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
 def run():
     page_title=t("🩺 Hypertension Risk Prediction")
     components.html(f"""
@@ -54,17 +70,20 @@ def run():
     st.session_state["age"] = age
     st.session_state["gender"] = gender
 
+    # Load the model as soon as the page opens so the Predict click only runs inference
+    hypertension_info = get_client().describe("hypertension")
+
     if avg_glucose < 70 or bmi < 10:
         st.warning(t("⚠️ Please enter realistic glucose and BMI values."))
         return
 
     # Encoding
-    gender_map = {"Male": 1, "Female": 0, "Other": 2}
-    married_map = {"Yes": 1, "No": 0}
-    work_map = {"Private": 2, "Self-employed": 3, "Govt_job": 0, "children": 1, "Never_worked": 4}
-    residence_map = {"Urban": 1, "Rural": 0}
-    smoke_map = {"never smoked": 2, "formerly smoked": 1, "smokes": 3, "Unknown": 0}
-    heart_disease = 1 if has_heart_disease == "Yes" else 0
+    gender_map = hypertension_category_map["gender"]
+    married_map = hypertension_category_map["ever_married"]
+    work_map = hypertension_category_map["work_type"]
+    residence_map = hypertension_category_map["Residence_type"]
+    smoke_map = hypertension_category_map["smoking_status"]
+    heart_disease = hypertension_category_map["heart_disease"][has_heart_disease]
 
     user_df = pd.DataFrame([{
         "gender": gender_map[gender],
@@ -78,11 +97,6 @@ def run():
         "smoking_status": smoke_map[smoking_status]
     }])
 
-    expected_order = [
-        'gender', 'age', 'heart_disease', 'ever_married',
-        'work_type', 'Residence_type', 'avg_glucose_level',
-        'bmi', 'smoking_status'
-    ]
     user_df = user_df[expected_order]
 
     # --- Button centered with full width in column ---
@@ -91,11 +105,9 @@ def run():
         predict_button = st.button(t("Predict Hypertension Risk"), use_container_width=True)
 
     if predict_button:
-        model = load_models()
-        hypertension_model = model['hypertension']
-
-        if hasattr(hypertension_model, "predict_proba"):
-            prob = hypertension_model.predict_proba(user_df)[0][1]
+        result = get_client().predict("hypertension", user_df.to_dict("records"))
+        if "probabilities" in result:
+            prob = result["probabilities"][0][1]
             st.metric(t("Hypertension Risk Probability"), f"{prob*100:.2f}%")
 
             # Categorize based on risk percentage
@@ -141,14 +153,9 @@ def run():
         # Feature importance section with spacing and fallback message
         st.markdown("---")
         st.subheader(t("📊 Feature Importance"))
-        try:
-            importance = hypertension_model.coef_[0]
-            fig, ax = plt.subplots(figsize=(8, 4))
-            ax.barh(expected_order, importance, color="#FF4081")
-            ax.set_xlabel(t("Weight"))
-            ax.grid(axis='x', linestyle='--', alpha=0.7)
-            st.pyplot(fig)
-        except AttributeError:
+        if "coef" in hypertension_info:
+            st.image(feature_importance_chart(hypertension_info["version"], tuple(hypertension_info["coef"]), t("Weight")))
+        else:
             st.info(t("Feature importance not available for this model."))
 
     st.markdown("---")  # Footer divider for clarity
\ No newline at end of file
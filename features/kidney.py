@@ -3,27 +3,12 @@ import streamlit.components.v1 as components
 import seaborn as sns
 import matplotlib.pyplot as plt
 from core.helper import create_input_df,t
-from core.models import load_models
-from code.imagerec import imagerecognise
+from core.inference_client import get_client
+from core.scan_store import scan_store
+from code.image_classifier import ImageTooLargeError, MAX_IMAGE_PIXELS
+from core.encoding import kidney_category_map as category_map
 import pandas as pd
 
-models=load_models()
-kidney_disease=models["kidney"]
-kidney_disease_mri=models["kidney_mri"]
-
-category_map = {
-    'red_blood_cells': {'normal': 0, 'abnormal': 1},
-    'pus_cell': {'normal': 0, 'abnormal': 1},
-    'pus_cell_clumps': {'notpresent': 0, 'present': 1},
-    'bacteria': {'notpresent': 0, 'present': 1},
-    'hypertension': {'no': 0, 'yes': 1},
-    'diabetes_mellitus': {'no': 0, 'yes': 1},
-    'coronary_artery_disease': {'no': 0, 'yes': 1},
-    'appetite': {'poor': 0, 'good': 1},
-    'pedal_edema': {'no': 0, 'yes': 1},
-    'anemia': {'no': 0, 'yes': 1}
-}
-
 def run():
     page_title=t("Chronic Kidney Disease Detection")
     # Custom Title with Gradient and Animation
@@ -151,7 +136,7 @@ def run():
         st.markdown("---")
         if st.button(t("🔍 Predict")):
             input_df = create_input_df(user_inputs, category_map)
-            prediction = kidney_disease.predict(input_df)
+            prediction = get_client().predict("kidney", input_df.to_dict("records"))["predictions"]
 
             if prediction[0] == 0:
                 kidney_diagnosis = t('⚠️ The patient is likely to have **Chronic Kidney Disease**.')
@@ -162,7 +147,7 @@ def run():
             st.session_state['kidney_diagnosis'] = kidney_diagnosis
 
             with st.expander(t("🔎 Show model details")):
-                st.json(kidney_disease.get_params())
+                st.json(get_client().describe("kidney").get("params", {}))
                 st.write(t("Model used: **Support Vector Machine (SVM)**"))
 
         # Heatmap
@@ -191,11 +176,16 @@ def run():
             # Prediction Button and Result
             if st.button(t("🔍 Predict"),key="predict_button"):
                 with st.spinner(t("🔬 Analyzing Image... Please wait.")):
-                    image_bytes = uploaded_file.read()
-                    y, conf = imagerecognise(image_bytes, kidney_disease_mri, "models/kidney_labels.txt")
+                    image_bytes = uploaded_file.getvalue()
+                    try:
+                        result = get_client().classify_image("kidney_mri", image_bytes)
+                    except ImageTooLargeError:
+                        st.error(f"❌ {t('Image is too large to analyze. Maximum size')}: {MAX_IMAGE_PIXELS // 1_000_000} MP")
+                        return
+                    y, conf = result["label"], result["confidence"]
                     st.session_state['kidney_prediction_label'] = y.strip().lower()
                     st.session_state['kidney_prediction_confidence'] = conf
-                    st.session_state['kidney_ultrasound_image'] = image_bytes
+                    st.session_state['kidney_image_handle'] = scan_store.put(image_bytes)
 
                 if y.strip().lower() == "normal":
                     predict_res=t("✅ Kidneys are Healthy!")
@@ -1,23 +1,14 @@
 import streamlit as st
 import streamlit.components.v1 as components
 import pandas as pd
-from core.models import load_models
+from core.inference_client import get_client
+from core.encoding import sex_map
 from core.helper import t
 
 # Initialize session state for tracking diagnoses
 if "diagnoses_history" not in st.session_state:
     st.session_state.diagnoses_history = []
 
-# Load the liver model with caching to optimize performance
-@st.cache_resource
-def load_liver_model():
-    try:
-        models = load_models()
-        return models['liver']
-    except Exception as e:
-        st.error(f"{t('❌ Failed to load model:')} {str(e)}")
-        return None
-
 # Medical reference ranges for liver parameters
 reference_ranges = {
     "Total_Bilirubin": {"min": 0.1, "max": 1.2, "unit": "mg/dL", "normal": "0.1-1.2 mg/dL"},
@@ -42,9 +33,6 @@ parameter_descriptions = {
     "Albumin_and_Globulin_Ratio": "Albumin_and_Globulin_Ratio_desc"
 }
 
-# Load liver model at the start
-liver_model = load_liver_model()
-
 def show_disclaimer():
     with st.expander(t("⚠️ Medical Disclaimer"), expanded=True):
         st.markdown(t("medical_disclaimer_text"))
@@ -80,7 +68,7 @@ def collect_patient_info():
             gender = st.selectbox(t("Gender"), gender_options)
 
             # Convert gender to int
-            sex = 0 if gender == "Male" else 1
+            sex = sex_map[gender]
 
             if name:
                 st.session_state["patient_name"] = name
@@ -91,7 +79,7 @@ def collect_patient_info():
             
             # Ensure gender is an int
             if isinstance(sex, str):
-                sex = 0 if sex == "Male" else 1
+                sex = sex_map.get(sex, 1)
                 st.session_state["patient_gender"] = sex
             
             st.info(f"👤 Name: {name}")
@@ -201,16 +189,13 @@ def make_prediction(sex, age, lab_values):
         ]
         
         # Make prediction
-        prediction = liver_model.predict([model_input])
-        probability = liver_model.predict_proba([model_input])
-        print("Model Input:", model_input)
-        print("Prediction:", prediction)
-        print("Probabilities:", probability)
-        print("Classes:", liver_model.classes_)
+        result = get_client().predict("liver", [model_input])
+        prediction = result["predictions"]
+        probability = result["probabilities"]
 
         return {
             "prediction": prediction[0],
-            "probability": probability[0][liver_model.classes_.tolist().index(prediction[0])]
+            "probability": probability[0][result["classes"].index(prediction[0])]
         }
     except Exception as e:
         st.error(f"Error making prediction: {str(e)}")
@@ -1,13 +1,11 @@
 import streamlit as st
-from code.imagerec import imagerecognise
 import streamlit.components.v1 as components
 from PIL import Image
-from core.models import load_models
+from core.inference_client import get_client
+from core.scan_store import scan_store
+from code.image_classifier import ImageTooLargeError, MAX_IMAGE_PIXELS
 from core.helper import t
 
-model=load_models()
-lung_caner_model=model['lung_cancer']
-
 def run():
     page_title=t("Lung Cancer Detection")
     # Custom animated title
@@ -61,8 +59,13 @@ def run():
     # Predict button
     if st.button(t("🔍 Predict")):
         with st.spinner(t("🔬 Analyzing Image... Please wait.")):
-            image_bytes = uploaded_file.read()
-            y, conf = imagerecognise(image_bytes, lung_caner_model, "models/lung_labels.txt")
+            image_bytes = uploaded_file.getvalue()
+            try:
+                result = get_client().classify_image("lung_cancer", image_bytes)
+            except ImageTooLargeError:
+                st.error(f"❌ {t('Image is too large to analyze. Maximum size')}: {MAX_IMAGE_PIXELS // 1_000_000} MP")
+                return
+            y, conf = result["label"], result["confidence"]
 
         # Result for Normal Lungs
         if y.strip().lower() == "normal":
@@ -121,4 +124,5 @@ def run():
         st.session_state["lung_image_name"] = uploaded_file.name
         st.session_state["lung_prediction_label"] = y.strip().lower()
         st.session_state["lung_prediction_confidence"] = conf
-        st.session_state['lung_image_bytes'] = image_bytes
\ No newline at end of file
+        # Only a handle lives in the session; the report copy sits in the bounded scan store
+        st.session_state['lung_image_handle'] = scan_store.put(image_bytes)
\ No newline at end of file
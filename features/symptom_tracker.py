@@ -2,7 +2,9 @@ import streamlit as st
 import streamlit.components.v1 as components
 from datetime import datetime
 import pandas as pd
-from core.helper import t,analyze_and_display_patterns, suggest_next_health_actions, analyze_symptom_patterns,COMMON_ILLNESS_PATTERNS
+from core.helper import t,analyze_and_display_patterns, suggest_next_health_actions, pattern_engine,COMMON_ILLNESS_PATTERNS
+from core.pattern_engine import IncrementalAnalyzer
+from core.symptom_store import get_symptom_store
 def run():
     page_title=t("🩺 Symptom Tracker")
     components.html(f"""
@@ -61,16 +63,28 @@ def run():
                 symptom_duration[symptom] = duration
                 st.markdown("---")
 
-    # Access session state for symptom log
-    if "symptom_log" not in st.session_state:
+    # Logged-in users keep their history in the persistent store; otherwise it lives in the session
+    user = st.session_state.get("logged_in_user")
+    user = user if isinstance(user, str) else None
+    if user:
+        # Read the history once per user; it is re-queried only after this session appends
+        if st.session_state.get("symptom_log_user") != user:
+            st.session_state["symptom_log"] = get_symptom_store().query(user)
+            st.session_state["symptom_log_user"] = user
+    elif "symptom_log" not in st.session_state or st.session_state.get("symptom_log_user"):
+        # Also drops a previous user's history after logout
         st.session_state["symptom_log"] = pd.DataFrame(columns=["Date", "Symptom", "Severity", "Duration"])
+        st.session_state["symptom_log_user"] = None
 
     if st.button(t("Log Symptoms")):
-        for symptom, severity in symptom_severity.items():
-            duration = symptom_duration.get(symptom, "Started today")
-            new_entry = pd.DataFrame([[log_date, symptom, severity, duration]], 
-                                    columns=["Date", "Symptom", "Severity", "Duration"])
-            st.session_state["symptom_log"] = pd.concat([st.session_state["symptom_log"], new_entry], ignore_index=True)
+        entries = [(log_date, symptom, severity, symptom_duration.get(symptom, "Started today"))
+                   for symptom, severity in symptom_severity.items()]
+        if user:
+            get_symptom_store().append(user, entries)
+            st.session_state["symptom_log"] = get_symptom_store().query(user)
+        elif entries:
+            new_entries = pd.DataFrame(entries, columns=["Date", "Symptom", "Severity", "Duration"])
+            st.session_state["symptom_log"] = pd.concat([st.session_state["symptom_log"], new_entries], ignore_index=True)
         st.success(t("Symptoms logged successfully!"))
         st.rerun()  # Refresh to show updated analysis
 
@@ -79,9 +93,12 @@ def run():
     if not st.session_state["symptom_log"].empty:
         st.dataframe(st.session_state["symptom_log"])
         
-        # Add pattern analysis
-        matches = analyze_symptom_patterns(st.session_state["symptom_log"])
-        analyze_and_display_patterns(st.session_state["symptom_log"])
+        # Add pattern analysis: the analyzer only folds in entries logged since the last rerun
+        if "symptom_analyzer" not in st.session_state or st.session_state.get("symptom_analyzer_user") != user:
+            st.session_state["symptom_analyzer"] = IncrementalAnalyzer(pattern_engine)
+            st.session_state["symptom_analyzer_user"] = user
+        matches = st.session_state["symptom_analyzer"].sync(st.session_state["symptom_log"]).matches()
+        analyze_and_display_patterns(st.session_state["symptom_log"], matches)
         suggest_next_health_actions(st.session_state["symptom_log"], matches)
     else:
         st.info(t("No symptoms logged yet. Start tracking your symptoms to see pattern analysis."))
\ No newline at end of file